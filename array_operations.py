@@ -3,42 +3,812 @@
 包含数组的增删改查、排序、查找等常用操作
 """
 
-class ArrayOperations:
+import bisect
+import heapq
+import mmap
+import os
+import struct
+import tempfile
+import time
+from array import array
+from multiprocessing import shared_memory
+
+from workers import join_workers, map_workers, start_workers
+
+
+class ArrayIndex:
+    """数组辅助索引基类
+    
+    ArrayOperations 每次修改数据后都会通知已注册的索引。
+    eager 模式下索引随修改增量维护；lazy 模式下只标记失效，
+    下次查询时再整体重建，适合写多读少的阶段。
+    """
+    def __init__(self, lazy=False):
+        self.lazy = lazy
+        self.dirty = True
+        # 维护开销统计：增量通知次数、整体重建次数和累计耗时（秒）
+        self.updates = 0
+        self.rebuilds = 0
+        self.seconds = 0.0
+    
+    def ensure(self, data):
+        """确保索引与数据一致（失效时重建）"""
+        if self.dirty:
+            start = time.perf_counter()
+            self.rebuild(data)
+            self.dirty = False
+            self.rebuilds += 1
+            self.seconds += time.perf_counter() - start
+    
+    def stats(self):
+        """返回维护开销统计"""
+        return {
+            "index": type(self).__name__,
+            "lazy": self.lazy,
+            "updates": self.updates,
+            "rebuilds": self.rebuilds,
+            "seconds": self.seconds,
+        }
+    
+    def rebuild(self, data):
+        """根据当前数据整体重建索引"""
+        raise NotImplementedError
+    
+    def on_insert(self, data, index, value):
+        """value 已插入到 data[index] 之后调用"""
+        if self.lazy or self.dirty:
+            self.dirty = True
+        else:
+            self._insert(data, index, value)
+    
+    def on_delete(self, data, index, value):
+        """data[index] 处的 value 已被删除之后调用"""
+        if self.lazy or self.dirty:
+            self.dirty = True
+        else:
+            self._delete(data, index, value)
+    
+    def on_update(self, data, index, old, new):
+        """data[index] 由 old 更新为 new 之后调用"""
+        if self.lazy or self.dirty:
+            self.dirty = True
+        else:
+            self._update(data, index, old, new)
+    
+    def on_insert_many(self, data, values):
+        """批量插入 values 之后调用"""
+        if self.lazy or self.dirty:
+            self.dirty = True
+        else:
+            self._insert_many(data, values)
+    
+    def on_delete_many(self, data, values):
+        """批量删除 values 之后调用"""
+        if self.lazy or self.dirty:
+            self.dirty = True
+        else:
+            self._delete_many(data, values)
+    
+    def on_update_many(self, data, indices, olds, news):
+        """批量更新之后调用，indices/olds/news 一一对应"""
+        for index, old, new in zip(indices, olds, news):
+            self.on_update(data, index, old, new)
+    
+    def on_permute(self, data):
+        """元素顺序改变（如排序、反转）但内容不变之后调用"""
+        self.dirty = True
+    
+    def on_reset(self, data):
+        """数据被任意修改之后调用"""
+        self.dirty = True
+    
+    def _insert(self, data, index, value):
+        self.dirty = True
+    
+    def _delete(self, data, index, value):
+        self.dirty = True
+    
+    def _update(self, data, index, old, new):
+        self.dirty = True
+    
+    def _insert_many(self, data, values):
+        self.dirty = True
+    
+    def _delete_many(self, data, values):
+        self.dirty = True
+
+
+class SortedIndex(ArrayIndex):
+    """有序视图索引，让二分查找不必每次都重新排序"""
+    def __init__(self, lazy=False):
+        super().__init__(lazy)
+        self.view = []
+    
+    def rebuild(self, data):
+        self.view = sorted(data)
+        # 类型化存储（array 或映射内存的 memoryview）的有序视图同样使用紧凑数组
+        if isinstance(data, array):
+            self.view = array(data.typecode, self.view)
+        elif isinstance(data, memoryview):
+            self.view = array(data.format, self.view)
+    
+    def on_permute(self, data):
+        """有序视图只依赖元素内容，与顺序无关"""
+        pass
+    
+    def _insert(self, data, index, value):
+        bisect.insort(self.view, value)
+    
+    def _delete(self, data, index, value):
+        del self.view[bisect.bisect_left(self.view, value)]
+    
+    def _update(self, data, index, old, new):
+        self._delete(data, index, old)
+        self._insert(data, index, new)
+    
+    def _insert_many(self, data, values):
+        # 视图本身有序，Timsort 识别出这一段后只需排序新值再线性合并
+        merged = sorted(self.view + self._same_kind(values))
+        self.view = self._same_kind(merged)
+    
+    def _delete_many(self, data, values):
+        positions = []
+        last, pos = None, -1
+        for value in sorted(values):
+            if positions and value == last:
+                pos += 1
+            else:
+                pos = bisect.bisect_left(self.view, value)
+            positions.append(pos)
+            last = value
+        self.view = _delete_positions(self.view, positions)
+    
+    def on_update_many(self, data, indices, olds, news):
+        # 同一位置可能被连续更新多次，只按内容的净变化维护视图；
+        # 有序视图只要求元素可比较，因此用排序后归并求差，不依赖哈希
+        removed, added = _sorted_difference(sorted(olds), sorted(news))
+        self.on_delete_many(data, removed)
+        self.on_insert_many(data, added)
+    
+    def _same_kind(self, values):
+        if isinstance(self.view, array):
+            return array(self.view.typecode, values)
+        return list(values)
+    
+    def search(self, value):
+        """在有序视图中查找，返回位置或-1"""
+        return _bisect_search(self.view, value)
+    
+    def search_many(self, values):
+        """批量查找，返回与values一一对应的位置列表"""
+        return _bisect_search_many(self.view, values)
+
+
+def _min2(a, b):
+    """取较小值，None 表示空（线段树中未使用的叶子）"""
+    if a is None:
+        return b
+    if b is None or not b < a:
+        return a
+    return b
+
+
+def _max2(a, b):
+    """取较大值，None 表示空（线段树中未使用的叶子）"""
+    if a is None:
+        return b
+    if b is None or not a < b:
+        return a
+    return b
+
+
+class MinMaxIndex(ArrayIndex):
+    """区间最值线段树
+    
+    叶子数取不小于 n 的2的幂，根节点即全局最值，O(1) 读取；
+    区间查询和单点更新 O(log n)，末尾追加/删除也只需更新一条路径；
+    位置 i 处的插入删除使后面的元素整体移位，只重写 i 之后的叶子，
+    再逐层用一次 map 修正覆盖它们的节点，O(n - i + log n)；
+    元素个数超过叶子数时才整体重建。
+    """
+    def __init__(self, lazy=False):
+        super().__init__(lazy)
+        self.capacity = 1
+        self.mins = [None, None]
+        self.maxs = [None, None]
+    
+    def rebuild(self, data):
+        capacity = 1
+        while capacity < len(data):
+            capacity *= 2
+        leaves = list(data) + [None] * (capacity - len(data))
+        self.capacity = capacity
+        self.mins = [None] * capacity + leaves
+        self.maxs = [None] * capacity + leaves
+        for i in range(capacity - 1, 0, -1):
+            self._pull(i)
+    
+    def _pull(self, i):
+        self.mins[i] = _min2(self.mins[2 * i], self.mins[2 * i + 1])
+        self.maxs[i] = _max2(self.maxs[2 * i], self.maxs[2 * i + 1])
+    
+    def _set(self, index, value):
+        i = index + self.capacity
+        self.mins[i] = self.maxs[i] = value
+        i //= 2
+        while i:
+            self._pull(i)
+            i //= 2
+    
+    def _refresh_tail(self, data, start):
+        """data[start:] 整体移位之后，重写这些叶子并逐层修正其上的节点"""
+        capacity = self.capacity
+        # 删除时原来的最后一个叶子也要清空
+        stop = min(len(data) + 1, capacity)
+        leaves = list(data[start:stop])
+        leaves += [None] * (stop - start - len(leaves))
+        mins, maxs = self.mins, self.maxs
+        mins[capacity + start:capacity + stop] = leaves
+        maxs[capacity + start:capacity + stop] = leaves
+        lo, hi = (capacity + start) // 2, (capacity + stop - 1) // 2
+        while lo:
+            mins[lo:hi + 1] = map(_min2, mins[2 * lo:2 * hi + 2:2], mins[2 * lo + 1:2 * hi + 2:2])
+            maxs[lo:hi + 1] = map(_max2, maxs[2 * lo:2 * hi + 2:2], maxs[2 * lo + 1:2 * hi + 2:2])
+            lo //= 2
+            hi //= 2
+    
+    def _insert(self, data, index, value):
+        if len(data) > self.capacity:
+            self.dirty = True
+        elif index == len(data) - 1:
+            self._set(index, value)
+        else:
+            self._refresh_tail(data, index)
+    
+    def _delete(self, data, index, value):
+        if index == len(data):
+            self._set(index, None)
+        else:
+            self._refresh_tail(data, index)
+    
+    def _update(self, data, index, old, new):
+        self._set(index, new)
+    
+    def global_min(self):
+        return self.mins[1]
+    
+    def global_max(self):
+        return self.maxs[1]
+    
+    def range_min(self, i, j):
+        """data[i:j] 的最小值，区间为空时返回 None"""
+        return self._query(self.mins, _min2, i, j)
+    
+    def range_max(self, i, j):
+        """data[i:j] 的最大值，区间为空时返回 None"""
+        return self._query(self.maxs, _max2, i, j)
+    
+    def _query(self, tree, combine, i, j):
+        result = None
+        lo, hi = i + self.capacity, j + self.capacity
+        while lo < hi:
+            if lo & 1:
+                result = combine(result, tree[lo])
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                result = combine(result, tree[hi])
+            lo //= 2
+            hi //= 2
+        return result
+
+
+class SparseTableIndex(ArrayIndex):
+    """区间最值稀疏表，适合只读数据
+    
+    构建 O(n log n)，任意区间查询 O(1)；
+    任何修改都会使其失效，下次查询时整体重建。
+    """
     def __init__(self):
-        self.data = []
+        super().__init__(lazy=True)
+        self.mins = []
+        self.maxs = []
     
-    def insert(self, index, value):
+    def rebuild(self, data):
+        self.mins = [list(data)]
+        self.maxs = [self.mins[0]]
+        width = 1
+        while 2 * width <= len(data):
+            prev_min, prev_max = self.mins[-1], self.maxs[-1]
+            self.mins.append(list(map(min, prev_min[:-width], prev_min[width:])))
+            self.maxs.append(list(map(max, prev_max[:-width], prev_max[width:])))
+            width *= 2
+    
+    def global_min(self):
+        return self.range_min(0, len(self.mins[0]))
+    
+    def global_max(self):
+        return self.range_max(0, len(self.maxs[0]))
+    
+    def range_min(self, i, j):
+        """data[i:j] 的最小值，区间为空时返回 None"""
+        if i >= j:
+            return None
+        k = (j - i).bit_length() - 1
+        return min(self.mins[k][i], self.mins[k][j - (1 << k)])
+    
+    def range_max(self, i, j):
+        """data[i:j] 的最大值，区间为空时返回 None"""
+        if i >= j:
+            return None
+        k = (j - i).bit_length() - 1
+        return max(self.maxs[k][i], self.maxs[k][j - (1 << k)])
+
+
+class ValueIndex(ArrayIndex):
+    """值到位置的哈希索引：每个值对应其所有出现位置的有序列表
+    
+    find/count/find_all 变为 O(1) 平均复杂度；末尾追加和删除 O(1)，
+    中间插入删除需要平移其后元素的位置记录，与数组移位同为 O(n)。
+    元素必须可哈希。
+    """
+    def __init__(self, lazy=False):
+        super().__init__(lazy)
+        self.positions = {}
+    
+    def rebuild(self, data):
+        positions = {}
+        for i, value in enumerate(data):
+            positions.setdefault(value, []).append(i)
+        self.positions = positions
+    
+    def _shift(self, values, threshold, delta):
+        """将 values 中各元素记录的、不小于 threshold 的位置平移 delta"""
+        for value in set(values):
+            plist = self.positions[value]
+            for k in range(bisect.bisect_left(plist, threshold), len(plist)):
+                plist[k] += delta
+    
+    def _insert(self, data, index, value):
+        if index < len(data) - 1:
+            # 插入点之后的元素原位置都不小于 index，整体后移一位
+            self._shift(data[index + 1:], index, 1)
+        bisect.insort(self.positions.setdefault(value, []), index)
+    
+    def _delete(self, data, index, value):
+        self._discard(value, index)
+        if index < len(data):
+            # 删除点之后的元素原位置都大于 index，整体前移一位
+            self._shift(data[index:], index + 1, -1)
+    
+    def _update(self, data, index, old, new):
+        self._discard(old, index)
+        bisect.insort(self.positions.setdefault(new, []), index)
+    
+    def _discard(self, value, index):
+        plist = self.positions[value]
+        del plist[bisect.bisect_left(plist, index)]
+        if not plist:
+            del self.positions[value]
+    
+    def find_all(self, value):
+        return list(self.positions.get(value, ()))
+    
+    def count(self, value):
+        return len(self.positions.get(value, ()))
+
+
+def _delete_positions(seq, positions, result=None):
+    """按升序且不重复的位置删除元素，用切片拼接一次性构造新序列"""
+    if result is None:
+        result = seq[:0]
+    prev = 0
+    for pos in positions:
+        result.extend(seq[prev:pos])
+        prev = pos + 1
+    result.extend(seq[prev:])
+    return result
+
+
+def _sorted_difference(a, b):
+    """归并两个有序序列，返回 (a 中多出的元素, b 中多出的元素)，按多重集合计数"""
+    only_a, only_b = [], []
+    i = j = 0
+    while i < len(a) and j < len(b):
+        if a[i] < b[j]:
+            only_a.append(a[i])
+            i += 1
+        elif b[j] < a[i]:
+            only_b.append(b[j])
+            j += 1
+        else:
+            i += 1
+            j += 1
+    only_a.extend(a[i:])
+    only_b.extend(b[j:])
+    return only_a, only_b
+
+
+def _bisect_search(sorted_data, value, lo=0):
+    """在有序序列中查找value第一次出现的位置，找不到返回-1"""
+    i = bisect.bisect_left(sorted_data, value, lo)
+    if i < len(sorted_data) and sorted_data[i] == value:
+        return i
+    return -1
+
+
+def _bisect_search_many(sorted_data, values):
+    """先将查询值排序，再单向扫过有序数据完成全部查找"""
+    values = list(values)
+    result = [-1] * len(values)
+    lo = 0
+    for i in sorted(range(len(values)), key=values.__getitem__):
+        lo = bisect.bisect_left(sorted_data, values[i], lo)
+        if lo < len(sorted_data) and sorted_data[lo] == values[i]:
+            result[i] = lo
+    return result
+
+
+_INSERTION_CUTOFF = 16
+_NINTHER_THRESHOLD = 128
+
+
+def introsort(arr, low=0, high=None):
+    """内省排序：原地将 arr[low..high] 升序排列
+    
+    三数取中/九数取中选择枢轴，三路划分处理重复元素，
+    小区间改用插入排序，递归深度超过 2*log2(n) 时退化为堆排序保证
+    O(n log n)，并用显式栈代替递归，不受递归深度限制。
+    元素只需支持 < 比较。
+    """
+    if high is None:
+        high = len(arr) - 1
+    if high - low < 1:
+        return arr
+    
+    stack = [(low, high, 2 * (high - low + 1).bit_length())]
+    while stack:
+        lo, hi, depth = stack.pop()
+        while hi - lo >= _INSERTION_CUTOFF:
+            if depth == 0:
+                _heap_sort(arr, lo, hi)
+                break
+            depth -= 1
+            lt, gt = _partition3(arr, lo, hi, _choose_pivot(arr, lo, hi))
+            # 较大的一侧入栈，较小的一侧继续循环，栈深度不超过 O(log n)
+            if lt - lo < hi - gt:
+                stack.append((gt + 1, hi, depth))
+                hi = lt - 1
+            else:
+                stack.append((lo, lt - 1, depth))
+                lo = gt + 1
+        else:
+            _insertion_sort(arr, lo, hi)
+    return arr
+
+
+def _median3(arr, i, j, k):
+    """返回 arr[i]、arr[j]、arr[k] 的中位数"""
+    a, b, c = arr[i], arr[j], arr[k]
+    if a < b:
+        if b < c:
+            return b
+        return c if a < c else a
+    if a < c:
+        return a
+    return c if b < c else b
+
+
+def _choose_pivot(arr, lo, hi):
+    """小区间三数取中，大区间使用 Tukey 九数取中"""
+    mid = (lo + hi) // 2
+    if hi - lo < _NINTHER_THRESHOLD:
+        return _median3(arr, lo, mid, hi)
+    step = (hi - lo) // 8
+    a = _median3(arr, lo, lo + step, lo + 2 * step)
+    b = _median3(arr, mid - step, mid, mid + step)
+    c = _median3(arr, hi - 2 * step, hi - step, hi)
+    if a < b:
+        if b < c:
+            return b
+        return c if a < c else a
+    if a < c:
+        return a
+    return c if b < c else b
+
+
+def _partition3(arr, lo, hi, pivot):
+    """三路划分（荷兰国旗），返回等于枢轴区间的边界 (lt, gt)"""
+    lt, i, gt = lo, lo, hi
+    while i <= gt:
+        x = arr[i]
+        if x < pivot:
+            arr[i] = arr[lt]
+            arr[lt] = x
+            lt += 1
+            i += 1
+        elif pivot < x:
+            arr[i] = arr[gt]
+            arr[gt] = x
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
+
+
+def _insertion_sort(arr, lo, hi):
+    """对 arr[lo..hi] 做插入排序"""
+    for i in range(lo + 1, hi + 1):
+        x = arr[i]
+        j = i - 1
+        while j >= lo and x < arr[j]:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = x
+
+
+def _heap_sort(arr, lo, hi):
+    """对 arr[lo..hi] 做堆排序"""
+    n = hi - lo + 1
+    for start in range(n // 2 - 1, -1, -1):
+        _sift_down(arr, lo, start, n)
+    for end in range(n - 1, 0, -1):
+        arr[lo], arr[lo + end] = arr[lo + end], arr[lo]
+        _sift_down(arr, lo, 0, end)
+
+
+def _sift_down(arr, lo, root, n):
+    x = arr[lo + root]
+    while True:
+        child = 2 * root + 1
+        if child >= n:
+            break
+        if child + 1 < n and arr[lo + child] < arr[lo + child + 1]:
+            child += 1
+        if not x < arr[lo + child]:
+            break
+        arr[lo + root] = arr[lo + child]
+        root = child
+    arr[lo + root] = x
+
+
+def _sort_shared_chunk(name, typecode, lo, hi):
+    """子进程中对共享内存里 [lo, hi) 区间的元素原地排序"""
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        chunk = array(typecode)
+        start, stop = lo * chunk.itemsize, hi * chunk.itemsize
+        with shm.buf[start:stop] as region:
+            chunk.frombytes(region)
+            introsort(chunk)
+            region[:] = memoryview(chunk).cast("B")
+    finally:
+        shm.close()
+
+
+def _sort_chunk(conn, chunk):
+    """子进程中对一个（经 pickle 传入的）列表分块排序，结果经管道送回"""
+    conn.send(introsort(chunk))
+    conn.close()
+
+
+class ArrayOperations:
+    def __init__(self, typecode=None, sorted_index=None, aggregate_index=None,
+                 value_index=False):
+        """
+        typecode: None 表示使用普通列表存储任意对象；
+        传入 array 模块的类型码（如 'i'、'q'、'd'）则使用紧凑的类型化数组，
+        只能存放同一种数值类型
+        sorted_index: None 表示不维护有序视图；
+        "eager" 表示随修改增量维护；"lazy" 表示修改后在下次查找时重建
+        aggregate_index: None 表示不维护最值索引；
+        "segment" 使用可增量更新的线段树；"sparse" 使用只读数据适用的稀疏表
+        value_index: True 时维护值到位置的哈希索引，加速 find/count/find_all
+        """
+        if sorted_index not in (None, "eager", "lazy"):
+            raise ValueError("sorted_index must be None, 'eager' or 'lazy'")
+        if aggregate_index not in (None, "segment", "sparse"):
+            raise ValueError("aggregate_index must be None, 'segment' or 'sparse'")
+        self.typecode = typecode
+        self.data = self._new_storage()
+        self._indexes = []
+        self._sorted_index = None
+        if sorted_index:
+            self._sorted_index = SortedIndex(lazy=sorted_index == "lazy")
+            self._attach_index(self._sorted_index)
+        self._aggregate_index = None
+        if aggregate_index == "segment":
+            self._aggregate_index = MinMaxIndex()
+        elif aggregate_index == "sparse":
+            self._aggregate_index = SparseTableIndex()
+        if self._aggregate_index:
+            self._attach_index(self._aggregate_index)
+        self._value_index = None
+        if value_index:
+            self._value_index = ValueIndex()
+            self._attach_index(self._value_index)
+    
+    def insert(self, index, value, return_data=True):
         """在指定位置插入元素"""
+        n = len(self.data)
         self.data.insert(index, value)
-        return self.data
+        if self._indexes:
+            self._notify("on_insert", self._clamp_index(index, n), value)
+        return self.data if return_data else None
     
-    def append(self, value):
+    def append(self, value, return_data=True):
         """在数组末尾添加元素"""
         self.data.append(value)
-        return self.data
+        if self._indexes:
+            self._notify("on_insert", len(self.data) - 1, value)
+        return self.data if return_data else None
     
     def delete(self, index):
         """删除指定位置的元素"""
         if 0 <= index < len(self.data):
-            return self.data.pop(index)
+            value = self.data.pop(index)
+            self._notify("on_delete", index, value)
+            return value
         return None
     
     def update(self, index, value):
         """更新指定位置的元素"""
         if 0 <= index < len(self.data):
+            old = self.data[index]
             self.data[index] = value
+            self._notify("on_update", index, old, value)
             return True
         return False
     
+    def extend(self, values, return_data=True):
+        """在数组末尾批量添加任意可迭代对象中的元素"""
+        values = self._new_storage(values)
+        self.data.extend(values)
+        self._notify("on_insert_many", values)
+        return self.data if return_data else None
+    
+    def insert_many(self, items, return_data=True):
+        """批量插入 (index, value) 对，一次遍历完成，O(n + k log k)
+        
+        index 均相对于插入前的数组，规则与 insert 相同；
+        同一位置的多个值按给出的顺序排列
+        """
+        n = len(self.data)
+        items = sorted(((self._clamp_index(i, n), v) for i, v in items),
+                       key=lambda item: item[0])
+        result = self._new_storage()
+        prev = 0
+        for index, value in items:
+            result.extend(self.data[prev:index])
+            result.append(value)
+            prev = index
+        result.extend(self.data[prev:])
+        self._replace_data(result)
+        self._notify("on_insert_many", [v for _, v in items])
+        return self.data if return_data else None
+    
+    def delete_many(self, indices):
+        """批量删除指定位置的元素，返回按位置排列的被删除元素
+        
+        越界位置被忽略，重复位置只删除一次
+        """
+        n = len(self.data)
+        positions = sorted({i for i in indices if 0 <= i < n})
+        removed = [self.data[i] for i in positions]
+        self._replace_data(_delete_positions(self.data, positions, self._new_storage()))
+        self._notify("on_delete_many", removed)
+        return removed
+    
+    def update_many(self, items):
+        """批量更新 (index, value) 对，返回成功更新的个数
+        
+        整批值先转换为存储类型，任何一个不合法时数据保持不变
+        """
+        indices, news = [], []
+        n = len(self.data)
+        for index, value in items:
+            if 0 <= index < n:
+                indices.append(index)
+                news.append(value)
+        news = self._new_storage(news)
+        olds = []
+        for index, value in zip(indices, news):
+            olds.append(self.data[index])
+            self.data[index] = value
+        self._notify("on_update_many", indices, olds, news)
+        return len(indices)
+    
+    @staticmethod
+    def _clamp_index(index, n):
+        """与 list.insert 一致：负索引从末尾计算，越界时截断到两端"""
+        if index < 0:
+            return max(index + n, 0)
+        return min(index, n)
+    
+    def _new_storage(self, values=()):
+        """创建与当前存储方式一致的容器"""
+        if self.typecode:
+            return array(self.typecode, values)
+        return list(values)
+    
+    def _copy_data(self):
+        """返回数据的独立副本"""
+        return self.data[:]
+    
+    def _replace_data(self, values):
+        """用 values 整体替换数据内容，保持 self.data 对象不变"""
+        self.data[:] = values
+    
+    def _attach_index(self, idx):
+        self._indexes.append(idx)
+        if not idx.lazy:
+            idx.ensure(self.data)
+    
+    def _notify(self, event, *args):
+        """把一次修改通知给所有索引，并累计各索引的维护耗时"""
+        for idx in self._indexes:
+            start = time.perf_counter()
+            getattr(idx, event)(self.data, *args)
+            idx.updates += 1
+            idx.seconds += time.perf_counter() - start
+            if not idx.lazy and idx.dirty:
+                idx.ensure(self.data)
+    
+    def index_stats(self):
+        """返回各索引的维护开销统计，用于判断某种负载下是否值得开启"""
+        return [idx.stats() for idx in self._indexes]
+    
+    def set_index_mode(self, lazy):
+        """切换所有索引的维护方式
+        
+        写入密集阶段切换为 lazy，修改只标记失效；
+        切回 eager 时立即重建一次，之后恢复增量维护。
+        """
+        for idx in self._indexes:
+            if isinstance(idx, SparseTableIndex):
+                continue
+            idx.lazy = lazy
+            if not lazy:
+                idx.ensure(self.data)
+    
+    def rebuild_indexes(self):
+        """直接修改 self.data 之后调用，使所有索引重新与数据同步"""
+        for idx in self._indexes:
+            idx.on_reset(self.data)
+            if not idx.lazy:
+                idx.ensure(self.data)
+    
     def find(self, value):
         """查找元素第一次出现的位置"""
+        if self._value_index:
+            self._value_index.ensure(self.data)
+            positions = self._value_index.positions.get(value)
+            return positions[0] if positions else -1
         try:
             return self.data.index(value)
         except ValueError:
             return -1
     
+    def find_all(self, value):
+        """查找元素出现的所有位置（升序）"""
+        if self._value_index:
+            self._value_index.ensure(self.data)
+            return self._value_index.find_all(value)
+        return [i for i, x in enumerate(self.data) if x == value]
+    
+    def count(self, value):
+        """统计元素出现的次数"""
+        if self._value_index:
+            self._value_index.ensure(self.data)
+            return self._value_index.count(value)
+        return self.data.count(value)
+    
     def binary_search(self, value):
         """二分查找（数组需要已排序）"""
+        if self._sorted_index:
+            self._sorted_index.ensure(self.data)
+            return self._sorted_index.search(value)
+        
         sorted_data = sorted(self.data)
         left, right = 0, len(sorted_data) - 1
         
@@ -52,6 +822,13 @@ class ArrayOperations:
                 right = mid - 1
         return -1
     
+    def binary_search_many(self, values):
+        """批量二分查找，一次扫过有序数据，返回与values对应的位置列表"""
+        if self._sorted_index:
+            self._sorted_index.ensure(self.data)
+            return self._sorted_index.search_many(values)
+        return _bisect_search_many(sorted(self.data), values)
+    
     def bubble_sort(self):
         """冒泡排序"""
         n = len(self.data)
@@ -59,21 +836,75 @@ class ArrayOperations:
             for j in range(0, n - i - 1):
                 if self.data[j] > self.data[j + 1]:
                     self.data[j], self.data[j + 1] = self.data[j + 1], self.data[j]
+        self._notify("on_permute")
         return self.data
     
-    def quick_sort(self, arr=None, low=0, high=None):
-        """快速排序"""
+    def quick_sort(self, arr=None, low=0, high=None, key=None, reverse=False):
+        """快速排序（内省排序实现，不改变原数组，返回排序后的副本）
+        
+        key/reverse 含义与内置 sorted 相同；指定 key 时排序是稳定的
+        """
         if arr is None:
-            arr = self.data.copy()
+            arr = self._copy_data()
         if high is None:
             high = len(arr) - 1
             
         if low < high:
-            pi = self.partition(arr, low, high)
-            self.quick_sort(arr, low, pi - 1)
-            self.quick_sort(arr, pi + 1, high)
+            if key is None:
+                introsort(arr, low, high)
+                if reverse:
+                    arr[low:high + 1] = arr[low:high + 1][::-1]
+            else:
+                # 以 (键, 原位置) 装饰保证稳定，且不会比较元素本身
+                segment = arr[low:high + 1]
+                sign = -1 if reverse else 1
+                decorated = [(key(x), sign * i) for i, x in enumerate(segment)]
+                introsort(decorated)
+                if reverse:
+                    decorated.reverse()
+                ordered = [segment[sign * i] for _, i in decorated]
+                if isinstance(arr, array):
+                    ordered = array(arr.typecode, ordered)
+                arr[low:high + 1] = ordered
         return arr
     
+    def parallel_sort(self, workers=None, min_chunk=50000):
+        """多进程并行排序，返回排序后的副本，结果与 quick_sort() 相同
+        
+        数据切分为 workers 个分块，由各个子进程分别做内省排序，再 k 路归并。
+        类型化存储的分块通过共享内存传递，避免 pickle 复制；
+        普通列表存储只能 pickle 分块传给子进程。
+        数据量不足 2*min_chunk 或 workers 为1时直接退回 quick_sort。
+        """
+        workers = workers or os.cpu_count() or 1
+        n = len(self.data)
+        workers = min(workers, n // min_chunk)
+        if workers <= 1:
+            return self.quick_sort()
+        
+        bounds = [n * i // workers for i in range(workers + 1)]
+        if not self.typecode:
+            runs = map_workers(_sort_chunk, [
+                (self.data[bounds[i]:bounds[i + 1]],) for i in range(workers)])
+            return list(heapq.merge(*runs))
+        
+        nbytes = n * self.data.itemsize
+        shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        try:
+            with shm.buf[:nbytes] as region:
+                region[:] = memoryview(self.data).cast("B")
+            join_workers(start_workers(_sort_shared_chunk, [
+                (shm.name, self.typecode, bounds[i], bounds[i + 1]) for i in range(workers)]))
+            with shm.buf[:nbytes] as region, region.cast(self.typecode) as view:
+                runs = [view[bounds[i]:bounds[i + 1]] for i in range(workers)]
+                result = array(self.typecode, heapq.merge(*runs))
+                for run in runs:
+                    run.release()
+        finally:
+            shm.close()
+            shm.unlink()
+        return result
+    
     def partition(self, arr, low, high):
         """快速排序的分区函数"""
         pivot = arr[high]
@@ -90,16 +921,43 @@ class ArrayOperations:
     def reverse(self):
         """反转数组"""
         self.data.reverse()
+        self._notify("on_permute")
         return self.data
     
     def get_max(self):
         """获取最大值"""
+        if self._aggregate_index and self.data:
+            self._aggregate_index.ensure(self.data)
+            return self._aggregate_index.global_max()
         return max(self.data) if self.data else None
     
     def get_min(self):
         """获取最小值"""
+        if self._aggregate_index and self.data:
+            self._aggregate_index.ensure(self.data)
+            return self._aggregate_index.global_min()
         return min(self.data) if self.data else None
     
+    def range_max(self, start, stop):
+        """获取 data[start:stop] 的最大值，区间为空时返回 None"""
+        start, stop, _ = slice(start, stop).indices(len(self.data))
+        if start >= stop:
+            return None
+        if self._aggregate_index:
+            self._aggregate_index.ensure(self.data)
+            return self._aggregate_index.range_max(start, stop)
+        return max(self.data[start:stop])
+    
+    def range_min(self, start, stop):
+        """获取 data[start:stop] 的最小值，区间为空时返回 None"""
+        start, stop, _ = slice(start, stop).indices(len(self.data))
+        if start >= stop:
+            return None
+        if self._aggregate_index:
+            self._aggregate_index.ensure(self.data)
+            return self._aggregate_index.range_min(start, stop)
+        return min(self.data[start:stop])
+    
     def size(self):
         """获取数组大小"""
         return len(self.data)
@@ -110,9 +968,423 @@ class ArrayOperations:
     
     def display(self):
         """显示数组内容"""
+        if self.typecode:
+            return self.data.tolist()
         return self.data
 
 
+def external_sort(source, output=None, typecode="q", memory_limit=64 * 1024 * 1024,
+                  fan_in=16, tmp_dir=None):
+    """外部归并排序，用于超出内存的数据
+    
+    source: 可迭代的数值序列，或由 array.tofile 写出的类型化二进制文件路径
+    output: 结果文件路径；为 None 时返回按升序产出元素的生成器
+    memory_limit: 生成有序段和归并缓冲区可使用的字节数
+    fan_in: 每一轮归并同时打开的有序段个数
+    
+    先把输入切成受内存限制的有序段（用 introsort 排序）写入临时文件，
+    有序段多于 fan_in 时分多轮归并，最后一轮写入 output 或逐个产出。
+    输出文件与输入格式相同，可直接交给 binary_search_file 查找。
+    """
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+    itemsize = array(typecode).itemsize
+    run_items = max(1, memory_limit // itemsize)
+    buffer_items = max(1, memory_limit // ((fan_in + 1) * itemsize))
+    
+    tmp = tempfile.TemporaryDirectory(dir=tmp_dir)
+    try:
+        runs = []
+        for chunk in _read_batches(source, typecode, run_items):
+            introsort(chunk)
+            runs.append(_write_run(tmp.name, chunk))
+        
+        while len(runs) > fan_in:
+            merged = []
+            for i in range(0, len(runs), fan_in):
+                group = runs[i:i + fan_in]
+                path = _write_run(tmp.name, array(typecode))
+                _merge_runs(group, typecode, buffer_items, path)
+                for run in group:
+                    os.remove(run)
+                merged.append(path)
+            runs = merged
+    except BaseException:
+        tmp.cleanup()
+        raise
+    
+    if output is not None:
+        try:
+            _merge_runs(runs, typecode, buffer_items, output)
+        finally:
+            tmp.cleanup()
+        return output
+    return _merge_to_generator(runs, typecode, buffer_items, tmp)
+
+
+def _read_batches(source, typecode, count):
+    """按每批 count 个元素读取输入，产出类型化数组"""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            while True:
+                batch = array(typecode)
+                try:
+                    batch.fromfile(f, count)
+                except EOFError:
+                    # 文件尾不足 count 个元素时，已读到的元素仍会写入 batch
+                    pass
+                if not batch:
+                    return
+                yield batch
+                if len(batch) < count:
+                    return
+    else:
+        batch = array(typecode)
+        for value in source:
+            batch.append(value)
+            if len(batch) >= count:
+                yield batch
+                batch = array(typecode)
+        if batch:
+            yield batch
+
+
+def _write_run(directory, data):
+    fd, path = tempfile.mkstemp(dir=directory, suffix=".run")
+    with os.fdopen(fd, "wb") as f:
+        data.tofile(f)
+    return path
+
+
+def _iter_run(path, typecode, buffer_items):
+    """带缓冲地逐个读出有序段文件中的元素"""
+    for batch in _read_batches(path, typecode, buffer_items):
+        yield from batch
+
+
+def _merge_runs(runs, typecode, buffer_items, output):
+    """k 路归并若干有序段文件，带缓冲写入 output"""
+    merged = heapq.merge(*(_iter_run(run, typecode, buffer_items) for run in runs))
+    with open(output, "wb") as f:
+        buffer = array(typecode)
+        for value in merged:
+            buffer.append(value)
+            if len(buffer) >= buffer_items:
+                buffer.tofile(f)
+                buffer = array(typecode)
+        buffer.tofile(f)
+
+
+def _merge_to_generator(runs, typecode, buffer_items, tmp):
+    try:
+        yield from heapq.merge(*(_iter_run(run, typecode, buffer_items) for run in runs))
+    finally:
+        tmp.cleanup()
+
+
+def binary_search_file(path, value, typecode="q"):
+    """在已排序的类型化二进制文件上做二分查找，返回位置或-1
+    
+    文件通过 mmap 映射，只有查找路径上访问到的页会被读入内存。
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return -1
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as raw, raw.cast(typecode) as view:
+                return _bisect_search(view, value)
+
+
+class MappedArrayOperations(ArrayOperations):
+    """基于内存映射文件的持久化数组
+    
+    数据以类型化二进制形式保存在文件中并通过 mmap 映射，打开时不读取数据，
+    页面按需加载；多个只读进程映射同一文件时共享同一份物理内存。
+    文件头记录类型码和元素个数，末尾追加按 growth 字节成块扩展文件，
+    flush() 把元素个数写回文件头并刷盘，是显式的持久化点。
+    
+    查询方法直接作用于映射内存（self.data 是 memoryview），不会复制成列表。
+    注意：持有 self.data 的引用会阻止文件扩展和关闭，
+    因此修改类方法默认不返回内部视图。
+    """
+    _MAGIC = b"AOPS"
+    _HEADER = struct.Struct("<4sc3xQ")
+    
+    def __init__(self, path, typecode="q", readonly=False, header=True,
+                 growth=1 << 20, assume_sorted=False, **index_options):
+        """
+        path: 数据文件路径，不存在时创建（只读模式除外）
+        header: False 表示文件是没有文件头的原始类型化数据
+        （如 external_sort 的输出），只能以只读方式打开
+        assume_sorted: 数据已升序排列时，二分查找直接在映射内存上进行
+        index_options: 传给 ArrayOperations 的索引选项
+        """
+        if not header and not readonly:
+            raise ValueError("files without header can only be opened read-only")
+        super().__init__(typecode=typecode, **index_options)
+        self.path = path
+        self.readonly = readonly
+        self.header = header
+        self.assume_sorted = assume_sorted
+        self.itemsize = array(typecode).itemsize
+        self._growth = max(1, growth // self.itemsize)
+        self._offset = self._HEADER.size if header else 0
+        self._mm = None
+        self._views = []
+        
+        exists = os.path.exists(path)
+        if readonly and not exists:
+            raise FileNotFoundError(path)
+        self._file = open(path, "rb" if readonly else ("r+b" if exists else "w+b"))
+        file_size = os.fstat(self._file.fileno()).st_size
+        if not header:
+            self._length = file_size // self.itemsize
+        elif file_size == 0:
+            self._length = 0
+            self._file.truncate(self._offset + self._growth * self.itemsize)
+        else:
+            magic, code, length = self._HEADER.unpack(self._file.read(self._HEADER.size))
+            if magic != self._MAGIC:
+                raise ValueError("not a mapped array file")
+            if code.decode() != typecode:
+                raise ValueError(f"file typecode is {code.decode()!r}, not {typecode!r}")
+            self._length = length
+        self._map()
+        if not readonly and header and file_size == 0:
+            self.flush()
+        self.rebuild_indexes()
+    
+    def _map(self):
+        """映射整个文件，并按元素个数切出 self.data 视图"""
+        size = os.fstat(self._file.fileno()).st_size
+        self.capacity = (size - self._offset) // self.itemsize
+        if size == 0:
+            # 空文件无法映射，用空数组的视图代替
+            self._view = memoryview(array(self.typecode))
+            self._views = [self._view]
+            self._set_length(0)
+            return
+        access = mmap.ACCESS_READ if self.readonly else mmap.ACCESS_WRITE
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=access)
+        raw = memoryview(self._mm)
+        region = raw[self._offset:self._offset + self.capacity * self.itemsize]
+        self._view = region.cast(self.typecode)
+        self._views = [raw, region, self._view]
+        self._set_length(self._length)
+    
+    def _unmap(self):
+        self.data.release()
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+    
+    def _set_length(self, length):
+        old = self.data
+        self._length = length
+        self.data = self._view[:length]
+        if isinstance(old, memoryview):
+            old.release()
+    
+    def _reserve(self, needed):
+        """容量不足时按 growth 成块扩展文件并重新映射"""
+        self._check_writable()
+        if needed <= self.capacity:
+            return
+        chunks = -(-(needed - self.capacity) // self._growth)
+        new_capacity = self.capacity + chunks * self._growth
+        self._unmap()
+        self._file.truncate(self._offset + new_capacity * self.itemsize)
+        self._map()
+    
+    def _check_writable(self):
+        if self.readonly:
+            raise PermissionError("mapped array is read-only")
+    
+    def flush(self):
+        """把元素个数写入文件头并将映射内容刷到磁盘"""
+        self._check_writable()
+        self._mm[:self._HEADER.size] = self._HEADER.pack(
+            self._MAGIC, self.typecode.encode(), self._length)
+        self._mm.flush()
+    
+    def close(self):
+        """刷盘（可写时）并解除映射、关闭文件"""
+        if self._file.closed:
+            return
+        if not self.readonly:
+            self.flush()
+        self._unmap()
+        self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def _move(self, dest, src, count):
+        """在映射内存中移动 count 个元素（memmove 语义，可重叠）"""
+        if count:
+            base = self._offset
+            self._mm.move(base + dest * self.itemsize, base + src * self.itemsize,
+                          count * self.itemsize)
+    
+    def insert(self, index, value, return_data=False):
+        """在指定位置插入元素，后续元素在映射内存中整体后移"""
+        # 先按类型码转换，值不合法时在移动映射内存之前就抛出异常
+        value = array(self.typecode, [value])[0]
+        n = self._length
+        index = self._clamp_index(index, n)
+        self._reserve(n + 1)
+        self._move(index + 1, index, n - index)
+        self._view[index] = value
+        self._set_length(n + 1)
+        self._notify("on_insert", index, value)
+        return self.data if return_data else None
+    
+    def append(self, value, return_data=False):
+        """在数组末尾添加元素"""
+        return self.insert(self._length, value, return_data)
+    
+    def delete(self, index):
+        """删除指定位置的元素，后续元素在映射内存中整体前移"""
+        self._check_writable()
+        n = self._length
+        if 0 <= index < n:
+            value = self.data[index]
+            self._move(index, index + 1, n - index - 1)
+            self._set_length(n - 1)
+            self._notify("on_delete", index, value)
+            return value
+        return None
+    
+    def update(self, index, value):
+        """更新指定位置的元素"""
+        self._check_writable()
+        return super().update(index, value)
+    
+    def update_many(self, items):
+        """批量更新 (index, value) 对，返回成功更新的个数"""
+        self._check_writable()
+        return super().update_many(items)
+    
+    def extend(self, values, return_data=False):
+        """在数组末尾批量添加元素"""
+        values = array(self.typecode, values)
+        n = self._length
+        self._reserve(n + len(values))
+        self._view[n:n + len(values)] = values
+        self._set_length(n + len(values))
+        self._notify("on_insert_many", values)
+        return self.data if return_data else None
+    
+    def insert_many(self, items, return_data=False):
+        self._check_writable()
+        items = list(items)
+        values = array(self.typecode, [v for _, v in items])
+        return super().insert_many(zip([i for i, _ in items], values), return_data)
+    
+    def delete_many(self, indices):
+        self._check_writable()
+        return super().delete_many(indices)
+    
+    def _copy_data(self):
+        return array(self.typecode, self.data)
+    
+    def _replace_data(self, values):
+        self._reserve(len(values))
+        self._view[:len(values)] = values
+        self._set_length(len(values))
+    
+    def reverse(self):
+        """原地反转映射内存中的数据"""
+        self._check_writable()
+        self.data[:] = self.data[::-1]
+        self._notify("on_permute")
+        return None
+    
+    def bubble_sort(self):
+        self._check_writable()
+        super().bubble_sort()
+        return None
+    
+    def _scan(self, value):
+        """在映射内存中查找 value，产出对齐的元素位置
+        
+        相等按值比较，与 ArrayOperations 和 array.index 一致。字节相同与值相等
+        等价时用 mmap.find 按字节查找；否则（±0.0、NaN、存储时会被舍入的
+        浮点数、整数存储中的 1.0 这类值）逐个元素比较。
+        """
+        if self._mm is None or self._length == 0:
+            return
+        try:
+            packed = array(self.typecode, [value])
+        except OverflowError:
+            return
+        except TypeError:
+            packed = None
+        if packed is None or packed[0] != value or (self.typecode in "fd" and value == 0):
+            yield from (i for i, x in enumerate(self.data) if x == value)
+            return
+        needle = packed.tobytes()
+        start = self._offset
+        end = self._offset + self._length * self.itemsize
+        while True:
+            pos = self._mm.find(needle, start, end)
+            if pos < 0:
+                return
+            if (pos - self._offset) % self.itemsize == 0:
+                yield (pos - self._offset) // self.itemsize
+                start = pos + self.itemsize
+            else:
+                start = pos + 1
+    
+    def find(self, value):
+        """查找元素第一次出现的位置"""
+        if self._value_index:
+            return super().find(value)
+        return next(self._scan(value), -1)
+    
+    def find_all(self, value):
+        """查找元素出现的所有位置（升序）"""
+        if self._value_index:
+            return super().find_all(value)
+        return list(self._scan(value))
+    
+    def count(self, value):
+        """统计元素出现的次数"""
+        if self._value_index:
+            return super().count(value)
+        return sum(1 for _ in self._scan(value))
+    
+    def _ensure_sorted_index(self):
+        """未指定 sorted_index 时按需挂上一个 lazy 有序视图
+        
+        视图是紧凑的类型化数组，只在数据修改后的下一次查找时重新排序，
+        而不是每次查找都把映射内存复制成列表再排序
+        """
+        if self._sorted_index is None:
+            self._sorted_index = SortedIndex(lazy=True)
+            self._attach_index(self._sorted_index)
+    
+    def binary_search(self, value):
+        """二分查找；assume_sorted 时直接在映射内存上查找，否则使用有序视图"""
+        if self.assume_sorted:
+            return _bisect_search(self.data, value)
+        self._ensure_sorted_index()
+        return super().binary_search(value)
+    
+    def binary_search_many(self, values):
+        """批量二分查找；assume_sorted 时直接在映射内存上查找，否则使用有序视图"""
+        if self.assume_sorted:
+            return _bisect_search_many(self.data, values)
+        self._ensure_sorted_index()
+        return super().binary_search_many(values)
+
+
 def demo():
     """演示数组操作"""
     print("=== 数组操作演示 ===")
@@ -156,6 +1428,72 @@ def demo():
     print(f"   最大值: {arr.get_max()}")
     print(f"   最小值: {arr.get_min()}")
     print(f"   是否为空: {arr.is_empty()}")
+    
+    print("\n9. 有序视图索引:")
+    indexed = ArrayOperations(sorted_index="eager")
+    for value in [5, 3, 8, 1, 7]:
+        indexed.append(value)
+    indexed.delete(0)
+    print(f"   数组: {indexed.display()}")
+    print(f"   查找元素7的位置: {indexed.binary_search(7)}")
+    print(f"   批量查找[8, 2, 1]: {indexed.binary_search_many([8, 2, 1])}")
+    
+    print("\n10. 类型化紧凑存储:")
+    typed = ArrayOperations(typecode="i")
+    for value in [5, 3, 8, 1]:
+        typed.append(value)
+    typed.insert(2, 7)
+    print(f"   数组: {typed.display()}")
+    print(f"   元素8的位置: {typed.find(8)}")
+    print(f"   最大值: {typed.get_max()}, 最小值: {typed.get_min()}")
+    print(f"   快速排序: {typed.quick_sort().tolist()}")
+    
+    print("\n11. 批量操作:")
+    batch = ArrayOperations()
+    batch.extend(range(10), return_data=False)
+    batch.insert_many([(0, -1), (5, 45), (10, 99)], return_data=False)
+    print(f"   批量插入后: {batch.display()}")
+    removed = batch.delete_many([0, 1, 2])
+    print(f"   批量删除位置0-2的元素{removed}: {batch.display()}")
+    batch.update_many([(0, 20), (1, 30)])
+    print(f"   批量更新位置0、1: {batch.display()}")
+    
+    print("\n12. 区间最值索引:")
+    ranged = ArrayOperations(aggregate_index="segment")
+    ranged.extend([4, 9, 2, 7, 5, 1, 8])
+    ranged.update(5, 6)
+    print(f"   数组: {ranged.display()}")
+    print(f"   最大值: {ranged.get_max()}, 最小值: {ranged.get_min()}")
+    print(f"   位置1-3的最大值: {ranged.range_max(1, 4)}, 最小值: {ranged.range_min(1, 4)}")
+    
+    print("\n13. 值位置索引:")
+    indexed = ArrayOperations(value_index=True)
+    indexed.extend([3, 1, 3, 2, 3])
+    indexed.insert(0, 2)
+    indexed.delete(2)
+    print(f"   数组: {indexed.display()}")
+    print(f"   元素3的位置: {indexed.find(3)}, 所有位置: {indexed.find_all(3)}, "
+          f"出现次数: {indexed.count(3)}")
+    stats = indexed.index_stats()[0]
+    print(f"   索引维护: {stats['updates']}次增量更新, {stats['rebuilds']}次重建")
+    
+    print("\n14. 外部归并排序:")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "sorted.bin")
+        values = [(i * 7919) % 1000 for i in range(1000)]
+        external_sort(values, path, typecode="q", memory_limit=800, fan_in=4)
+        print(f"   1000个元素、每段最多100个元素排序后，元素500的位置: "
+              f"{binary_search_file(path, 500, typecode='q')}")
+        
+        print("\n15. 内存映射持久化数组:")
+        path = os.path.join(tmp, "mapped.bin")
+        with MappedArrayOperations(path, typecode="q") as mapped:
+            mapped.extend([5, 3, 8, 1])
+            mapped.insert(2, 7)
+            mapped.delete(0)
+        with MappedArrayOperations(path, typecode="q", readonly=True) as mapped:
+            print(f"   重新打开后: {mapped.display()}")
+            print(f"   元素8的位置: {mapped.find(8)}, 最大值: {mapped.get_max()}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,228 @@
+"""
+进制转换练习demo
+包含任意进制（2~36）的整数与字符串互相转换：整列批量转换、
+超大整数的分治转换，以及把字符串解析回整数
+
+栈实现中的 StackApplications.decimal_to_binary 每次入栈一个二进制位，
+再逐个拼接字符串，作为这里各个函数的对照实现
+"""
+
+import functools
+import itertools
+import math
+import operator
+import re
+
+from stack import StackApplications
+
+DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+# 这些进制由内置 format 直接在C代码中完成转换
+_FORMAT_SPECS = {2: "b", 8: "o", 10: "d", 16: "x"}
+
+# 超过这个位数的整数按分治法转换；十进制的 str/int 在3.11起默认最多4300位，
+# 叶子节点保持在这个限制之内
+_DC_THRESHOLD_BITS = 2048
+_LEAF_BITS = 1024
+_PARSE_LEAF_DIGITS = 512
+
+# 查表转换时每张表最多的条目数
+_TABLE_LIMIT = 4096
+
+
+def _check_base(base):
+    if not 2 <= base <= 36:
+        raise ValueError("base must be between 2 and 36")
+
+
+@functools.lru_cache(maxsize=None)
+def _digit_table(base):
+    """返回 (width, power, table)：table[r] 是 r 补齐到 width 位的 base 进制字符串，power = base**width"""
+    width = 1
+    while base ** (width + 1) <= _TABLE_LIMIT:
+        width += 1
+    table = ["".join(digits) for digits in itertools.product(DIGITS[:base], repeat=width)]
+    return width, base ** width, table
+
+
+@functools.lru_cache(maxsize=None)
+def _digit_pattern(base):
+    """匹配可选符号加 base 进制数字（不区分大小写）的正则"""
+    chars = re.escape(DIGITS[:base] + DIGITS[10:base].upper())
+    return re.compile(f"[+-]?[{chars}]+")
+
+
+def _to_base_small(n, base):
+    """非负整数转换，每次 divmod 取下 width 位并查表"""
+    spec = _FORMAT_SPECS.get(base)
+    if spec:
+        return format(n, spec)
+    _, power, table = _digit_table(base)
+    parts = []
+    while n:
+        n, r = divmod(n, power)
+        parts.append(table[r])
+    return "".join(reversed(parts)).lstrip("0") or "0"
+
+
+def _to_base_dc(n, base, powers, leaf_digits, level, width):
+    """分治转换：按 powers[level] = base^(leaf_digits·2^level) 拆成高低两半
+    
+    低半部分补零到固定宽度；width 为 0 表示不补零（最高位部分）
+    """
+    if level < 0:
+        digits = _to_base_small(n, base)
+        return digits.zfill(width) if width else digits
+    high, low = divmod(n, powers[level])
+    low_width = leaf_digits << level
+    if not width and not high:
+        return _to_base_dc(low, base, powers, leaf_digits, level - 1, 0)
+    return (_to_base_dc(high, base, powers, leaf_digits, level - 1, width - low_width if width else 0)
+            + _to_base_dc(low, base, powers, leaf_digits, level - 1, low_width))
+
+
+def to_base(n, base=2):
+    """把整数转换为 base 进制字符串（小写字母，负数带 '-'）
+    
+    2、8、16进制以及不超过阈值的整数直接转换；更大的整数先算出
+    base^k、base^2k、base^4k……，再递归地按这些幂拆成高低两半分别转换，
+    避免每次只取一位时反复对整个大整数做除法
+    """
+    n = operator.index(n)
+    _check_base(base)
+    if n < 0:
+        return "-" + to_base(-n, base)
+    if n.bit_length() <= _DC_THRESHOLD_BITS or base in (2, 8, 16):
+        return _to_base_small(n, base)
+    
+    leaf_digits = int(_LEAF_BITS / math.log2(base))
+    powers = [base ** leaf_digits]
+    while 2 * powers[-1].bit_length() <= n.bit_length():
+        powers.append(powers[-1] * powers[-1])
+    return _to_base_dc(n, base, powers, leaf_digits, len(powers) - 1, 0)
+
+
+def _convert_column(values, base):
+    """把一整列非超大整数转换为 base 进制
+    
+    内置进制一次 map(format)；其他进制按列做 divmod：每一轮用 map 对整列
+    取下 width 位并查表，最后把各轮的结果按行拼接，去掉前导零
+    """
+    spec = _FORMAT_SPECS.get(base)
+    if spec:
+        return list(map(format, values, itertools.repeat(spec)))
+    width, power, table = _digit_table(base)
+    rest = list(map(abs, values))
+    largest = max(rest)
+    columns = []
+    while largest:
+        columns.append(list(map(table.__getitem__, map(operator.mod, rest, itertools.repeat(power)))))
+        rest = list(map(operator.floordiv, rest, itertools.repeat(power)))
+        largest //= power
+    if not columns:
+        return ["0"] * len(values)
+    columns.reverse()
+    digits = map("".join, zip(*columns))
+    digits = [d.lstrip("0") or "0" for d in digits]
+    if min(values) < 0:
+        digits = ["-" + d if v < 0 else d for v, d in zip(values, digits)]
+    return digits
+
+
+def to_base_many(numbers, base=2):
+    """把一组整数批量转换为 base 进制字符串，结果与逐个调用 to_base 相同
+    
+    整列一起处理，每个数字不再单独进入 Python 层的循环；
+    超过分治阈值的超大整数单独交给 to_base
+    """
+    _check_base(base)
+    values = list(map(operator.index, numbers))
+    if not values:
+        return []
+    if max(map(int.bit_length, values)) <= _DC_THRESHOLD_BITS:
+        return _convert_column(values, base)
+    
+    huge = [v.bit_length() > _DC_THRESHOLD_BITS for v in values]
+    result = _convert_column([0 if big else v for v, big in zip(values, huge)], base)
+    for i in itertools.compress(range(len(values)), huge):
+        result[i] = to_base(values[i], base)
+    return result
+
+
+def _parse_dc(digits, base, powers):
+    """分治解析：低半部分长度取叶子长度乘以2的幂，便于复用 powers 中的幂"""
+    if len(digits) <= _PARSE_LEAF_DIGITS:
+        return int(digits, base)
+    low_len = _PARSE_LEAF_DIGITS
+    while low_len * 2 < len(digits):
+        if low_len * 2 not in powers:
+            powers[low_len * 2] = powers[low_len] ** 2
+        low_len *= 2
+    return (_parse_dc(digits[:-low_len], base, powers) * powers[low_len]
+            + _parse_dc(digits[-low_len:], base, powers))
+
+
+def from_base(s, base=2):
+    """把 base 进制字符串解析为整数，是 to_base 的逆操作
+    
+    只接受可选的正负号加数字（字母不区分大小写，首尾空白忽略）；
+    2、8、16进制以及较短的字符串直接由 int 解析，更长的字符串
+    拆成高低两半分别解析，再用一次大整数乘法合并
+    """
+    _check_base(base)
+    s = s.strip()
+    if not _digit_pattern(base).fullmatch(s):
+        raise ValueError(f"invalid literal for base {base}: {s!r}")
+    if len(s) <= _PARSE_LEAF_DIGITS + 1 or base in (2, 4, 8, 16, 32):
+        return int(s, base)
+    
+    digits = s.lstrip("+-")
+    value = _parse_dc(digits, base, {_PARSE_LEAF_DIGITS: base ** _PARSE_LEAF_DIGITS})
+    return -value if s[0] == "-" else value
+
+
+def from_base_many(strings, base=2):
+    """把一组 base 进制字符串批量解析为整数"""
+    _check_base(base)
+    strings = list(map(str.strip, strings))
+    if not strings:
+        return []
+    pattern = _digit_pattern(base)
+    if not all(map(pattern.fullmatch, strings)):
+        bad = next(s for s in strings if not pattern.fullmatch(s))
+        raise ValueError(f"invalid literal for base {base}: {bad!r}")
+    if max(map(len, strings)) <= _PARSE_LEAF_DIGITS + 1 or base in (2, 4, 8, 16, 32):
+        return list(map(int, strings, itertools.repeat(base)))
+    return [from_base(s, base) for s in strings]
+
+
+def demo():
+    """演示进制转换"""
+    print("=== 进制转换演示 ===")
+    
+    print("1. 单个整数转换:")
+    for n, base in [(10, 2), (255, 16), (-42, 3), (123456789, 36)]:
+        digits = to_base(n, base)
+        print(f"   {n} -> {base}进制: {digits}, 解析回: {from_base(digits, base)}")
+    
+    print("\n2. 整列批量转换:")
+    numbers = [0, 7, 100, -100, 2024]
+    for base in (2, 7, 36):
+        print(f"   {numbers} -> {base}进制: {to_base_many(numbers, base)}")
+    print(f"   解析回: {from_base_many(to_base_many(numbers, 7), 7)}")
+    
+    print("\n3. 超大整数分治转换:")
+    big = 3 ** 20000 - 1
+    digits = to_base(big, 10)
+    print(f"   3^20000-1 有 {len(digits)} 位十进制数字，末尾: ...{digits[-10:]}")
+    print(f"   7进制往返一致: {from_base(to_base(big, 7), 7) == big}")
+    
+    print("\n4. 与栈实现的 decimal_to_binary 对照:")
+    sample = list(range(2000)) + [2 ** 64 - 1, 10 ** 30]
+    expected = [StackApplications.decimal_to_binary(n) for n in sample]
+    print(f"   {len(sample)}个整数逐个转换一致: {[to_base(n, 2) for n in sample] == expected}")
+    print(f"   {len(sample)}个整数批量转换一致: {to_base_many(sample, 2) == expected}")
+
+
+if __name__ == "__main__":
+    demo()
@@ -0,0 +1,1064 @@
+"""
+数据结构性能基准测试
+对比各实现与Python内置结构的吞吐量、延迟分位数和峰值内存，
+结果可输出为JSON，便于在两次运行之间比较性能回归
+
+用法:
+    python benchmark.py                           # 运行默认负载并打印表格
+    python benchmark.py --sizes 1000 10000 --json result.json
+    python benchmark.py --only stack,queue --baseline old.json
+"""
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from collections import deque
+
+from array_operations import ArrayOperations
+from base_conversion import from_base, from_base_many, to_base, to_base_many
+from binary_tree import BinarySearchTree, TreeNode
+from hash_table import HashNode, HashTableChaining, HashTableOpenAddressing
+from linked_list import (ConcurrentDoublyLinkedList, DoublyLinkedList, DoublyListNode, LinkedList, ListNode, LRUCache,
+                         PersistentLinkedList, PooledLinkedList, SkipLinkedList, SkipListNode,
+                         UnrolledLinkedList, UnrolledNode)
+from queue import ArrayQueue, CircularQueue, Deque, LinkedQueue, QueueNode
+from stack import (ArrayStack, CompiledExpression, LinkedStack, SegmentedArrayStack,
+                   SlidingWindowAggregator, StackApplications, StackNode)
+
+DEFAULT_SIZES = (1000, 10000)
+SEED = 12345
+
+
+class Workload:
+    """一个可重复的基准负载
+    
+    setup(n, rng) 构造初始状态，op(state, i) 执行第 i 次操作，共执行 n 次；
+    max_size 用于跳过在大规模下耗时不可接受的（如O(n²)）负载
+    """
+    def __init__(self, group, name, impl, setup, op, max_size=None):
+        self.group = group
+        self.name = name
+        self.impl = impl
+        self.setup = setup
+        self.op = op
+        self.max_size = max_size
+
+
+def _filled(factory, add, keys=None, sized=False):
+    """生成 setup 函数：用 add 把 0..n-1 放入 factory() 创建的结构
+    
+    sized 为 True 时以 factory(n) 创建（如需要指定容量的循环队列）
+    """
+    def setup(n, rng):
+        structure = factory(n) if sized else factory()
+        for i in range(n):
+            add(structure, i)
+        queries = [rng.randrange(n) for _ in range(n)] if keys == "random" else None
+        return structure, queries
+    return setup
+
+
+def _empty(factory, sized=False):
+    def setup(n, rng):
+        return (factory(n) if sized else factory()), None
+    return setup
+
+
+def _keys(order):
+    """生成 setup 函数：构造空结构和按 order（sorted/random）排列的键"""
+    def make(factory):
+        def setup(n, rng):
+            keys = list(range(n))
+            if order == "random":
+                rng.shuffle(keys)
+            return factory(), keys
+        return setup
+    return make
+
+
+def _bst_filled(order):
+    def setup(n, rng):
+        tree, keys = _keys(order)(BinarySearchTree)(n, rng)
+        for key in keys:
+            tree.insert(key)
+        return tree, keys
+    return setup
+
+
+def default_workloads():
+    """仓库中全部数据结构的标准负载，以及对应的内置结构对照组"""
+    w = []
+    # 数组：末尾追加、中间插入、中间删除、按值查找
+    for impl, factory, append, insert, delete, find in [
+        ("ArrayOperations", ArrayOperations,
+         lambda a, i: a.append(i, return_data=False),
+         lambda a, i: a.insert(a.size() // 2, i, return_data=False),
+         lambda a, i: a.delete(a.size() // 2),
+         lambda a, v: a.find(v)),
+        ("list", list, list.append,
+         lambda a, i: a.insert(len(a) // 2, i),
+         lambda a, i: a.pop(len(a) // 2),
+         list.index),
+    ]:
+        w.append(Workload("array", "append", impl, _empty(factory),
+                          lambda s, i, f=append: f(s[0], i)))
+        w.append(Workload("array", "insert_middle", impl, _empty(factory),
+                          lambda s, i, f=insert: f(s[0], i)))
+        w.append(Workload("array", "delete_middle", impl, _filled(factory, append),
+                          lambda s, i, f=delete: f(s[0], i)))
+        w.append(Workload("array", "find", impl, _filled(factory, append, "random"),
+                          lambda s, i, f=find: f(s[0], s[1][i])))
+    
+    # 链表：末尾追加、中间插入、按值删除、按值查找
+    w.append(Workload("linked_list", "append", "LinkedList", _empty(LinkedList),
+                      lambda s, i: s[0].append(i)))
+    w.append(Workload("linked_list", "append", "list", _empty(list),
+                      lambda s, i: s[0].append(i)))
+    w.append(Workload("linked_list", "insert_middle", "LinkedList", _empty(LinkedList),
+                      lambda s, i: s[0].insert(s[0].length() // 2, i), max_size=10000))
+    w.append(Workload("linked_list", "insert_middle", "list", _empty(list),
+                      lambda s, i: s[0].insert(len(s[0]) // 2, i)))
+    w.append(Workload("linked_list", "delete", "LinkedList",
+                      _filled(LinkedList, LinkedList.append, "random"),
+                      lambda s, i: s[0].delete(s[1][i]), max_size=10000))
+    w.append(Workload("linked_list", "delete", "list", _filled(list, list.append, "random"),
+                      lambda s, i: s[1][i] in s[0] and s[0].remove(s[1][i])))
+    w.append(Workload("linked_list", "find", "LinkedList",
+                      _filled(LinkedList, LinkedList.append, "random"),
+                      lambda s, i: s[0].find(s[1][i]), max_size=10000))
+    w.append(Workload("linked_list", "find", "list", _filled(list, list.append, "random"),
+                      lambda s, i: s[0].index(s[1][i])))
+    w.append(Workload("linked_list", "find", "UnrolledLinkedList",
+                      _filled(UnrolledLinkedList, UnrolledLinkedList.append, "random"),
+                      lambda s, i: s[0].find(s[1][i])))
+    
+    # 按位置访问/插入/删除：单链表 O(n)，可索引跳表期望 O(log n)
+    for impl, factory, max_size in [("LinkedList", LinkedList, 10000),
+                                    ("SkipLinkedList", SkipLinkedList, None),
+                                    ("UnrolledLinkedList", UnrolledLinkedList, None),
+                                    ("list", list, None)]:
+        append = list.append if factory is list else factory.append
+        get = list.__getitem__ if factory is list else factory.get
+        delete_at = list.pop if factory is list else factory.delete_at
+        w.append(Workload("linked_list", "get_random", impl,
+                          _filled(factory, append, "random"),
+                          lambda s, i, f=get: f(s[0], s[1][i]), max_size))
+        w.append(Workload("linked_list", "insert_random", impl,
+                          _filled(factory, append, "random"),
+                          lambda s, i: s[0].insert(s[1][i], i), max_size))
+        w.append(Workload("linked_list", "delete_at_random", impl,
+                          _filled(factory, append, "random"),
+                          lambda s, i, f=delete_at: f(s[0], s[1][i] % (len(s[1]) - i)),
+                          max_size))
+    
+    # 双向链表：按值删除需要线性查找，按节点句柄删除为O(1)
+    def dll_with_handles(n, rng):
+        dll = DoublyLinkedList()
+        handles = [dll.append(i) for i in range(n)]
+        rng.shuffle(handles)
+        return dll, handles
+    w.append(Workload("linked_list", "delete", "DoublyLinkedList",
+                      _filled(DoublyLinkedList, DoublyLinkedList.append, "random"),
+                      lambda s, i: s[0].delete(s[1][i]), max_size=10000))
+    w.append(Workload("linked_list", "remove_node", "DoublyLinkedList", dll_with_handles,
+                      lambda s, i: s[0].remove_node(s[1][i])))
+    # 在随机节点处拆开再接回：只改指针，不复制元素
+    w.append(Workload("linked_list", "split_concat", "DoublyLinkedList", dll_with_handles,
+                      lambda s, i: s[0].concat(s[0].split_at(s[1][i]))))
+    
+    # LRU缓存：容量为 n/10，键在 [0, n/5) 内随机分布，约一半访问命中
+    def lru_setup(n, rng):
+        cache = LRUCache(max(1, n // 10))
+        keys = [rng.randrange(max(1, n // 5)) for _ in range(n)]
+        for key in keys[:n // 10]:
+            cache.put(key, key)
+        return cache, keys
+    w.append(Workload("lru_cache", "put", "LRUCache", lru_setup,
+                      lambda s, i: s[0].put(s[1][i], i)))
+    w.append(Workload("lru_cache", "get", "LRUCache", lru_setup,
+                      lambda s, i: s[0].get(s[1][i])))
+    
+    # 栈：连续入栈、连续出栈
+    for impl, factory, push, pop in [
+        ("ArrayStack", ArrayStack, ArrayStack.push, ArrayStack.pop),
+        ("LinkedStack", LinkedStack, LinkedStack.push, LinkedStack.pop),
+        ("SegmentedArrayStack", SegmentedArrayStack,
+         SegmentedArrayStack.push, SegmentedArrayStack.pop),
+        ("list", list, list.append, list.pop),
+    ]:
+        w.append(Workload("stack", "push", impl, _empty(factory),
+                          lambda s, i, f=push: f(s[0], i)))
+        w.append(Workload("stack", "pop", impl, _filled(factory, push),
+                          lambda s, i, f=pop: f(s[0])))
+    
+    # 队列：连续入队、连续出队
+    for impl, factory, enqueue, dequeue in [
+        ("ArrayQueue", ArrayQueue, ArrayQueue.enqueue, ArrayQueue.dequeue),
+        ("LinkedQueue", LinkedQueue, LinkedQueue.enqueue, LinkedQueue.dequeue),
+        ("CircularQueue", CircularQueue, CircularQueue.enqueue, CircularQueue.dequeue),
+        ("Deque", Deque, Deque.add_rear, Deque.remove_front),
+        ("deque", deque, deque.append, deque.popleft),
+    ]:
+        sized = factory is CircularQueue
+        w.append(Workload("queue", "enqueue", impl, _empty(factory, sized),
+                          lambda s, i, f=enqueue: f(s[0], i)))
+        w.append(Workload("queue", "dequeue", impl, _filled(factory, enqueue, sized=sized),
+                          lambda s, i, f=dequeue: f(s[0])))
+    
+    # 二叉搜索树：有序键与随机键的插入和查找（有序键会退化成链表）
+    for order in ("sorted", "random"):
+        w.append(Workload("bst", f"insert_{order}", "BinarySearchTree",
+                          _keys(order)(BinarySearchTree),
+                          lambda s, i: s[0].insert(s[1][i])))
+        w.append(Workload("bst", f"search_{order}", "BinarySearchTree", _bst_filled(order),
+                          lambda s, i: s[0].search(s[1][i])))
+        w.append(Workload("bst", f"insert_{order}", "set", _keys(order)(set),
+                          lambda s, i: s[0].add(s[1][i])))
+        w.append(Workload("bst", f"search_{order}", "set",
+                          lambda n, rng, o=order: (set(range(n)), _keys(o)(list)(n, rng)[1]),
+                          lambda s, i: s[1][i] in s[0]))
+    
+    # 哈希表：插入与查找
+    for impl, factory, put, get in [
+        ("HashTableChaining", lambda: HashTableChaining(1024),
+         HashTableChaining.put, HashTableChaining.get),
+        ("HashTableOpenAddressing", HashTableOpenAddressing,
+         HashTableOpenAddressing.put, HashTableOpenAddressing.get),
+        ("dict", dict, dict.__setitem__, dict.__getitem__),
+    ]:
+        w.append(Workload("hash_table", "put", impl, _keys("random")(factory),
+                          lambda s, i, f=put: f(s[0], s[1][i], i)))
+        w.append(Workload("hash_table", "get", impl,
+                          lambda n, rng, f=factory, p=put: _hash_filled(f, p, n, rng),
+                          lambda s, i, f=get: f(s[0], s[1][i])))
+    return w
+
+
+def _hash_filled(factory, put, n, rng):
+    table, keys = _keys("random")(factory)(n, rng)
+    for key in keys:
+        put(table, key, key)
+    rng.shuffle(keys)
+    return table, keys
+
+
+def _percentile(sorted_values, q):
+    if not sorted_values:
+        return None
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+def run_workload(workload, n, seed=SEED):
+    """运行一个负载三遍：计时测吞吐量、逐次计时测延迟分位数、tracemalloc测峰值内存"""
+    op = workload.op
+    
+    state = workload.setup(n, random.Random(seed))
+    start = time.perf_counter()
+    for i in range(n):
+        op(state, i)
+    seconds = time.perf_counter() - start
+    
+    state = workload.setup(n, random.Random(seed))
+    latencies = [0] * n
+    clock = time.perf_counter_ns
+    for i in range(n):
+        t0 = clock()
+        op(state, i)
+        latencies[i] = clock() - t0
+    latencies.sort()
+    
+    tracemalloc.start()
+    try:
+        state = workload.setup(n, random.Random(seed))
+        for i in range(n):
+            op(state, i)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    del state
+    
+    return {
+        "group": workload.group,
+        "workload": workload.name,
+        "impl": workload.impl,
+        "size": n,
+        "ops": n,
+        "seconds": seconds,
+        "ops_per_sec": n / seconds if seconds > 0 else None,
+        "latency_ns": {
+            "p50": _percentile(latencies, 0.50),
+            "p90": _percentile(latencies, 0.90),
+            "p99": _percentile(latencies, 0.99),
+            "max": latencies[-1] if latencies else None,
+        },
+        "peak_memory_bytes": peak,
+    }
+
+
+def run_suite(sizes=DEFAULT_SIZES, groups=None, seed=SEED, workloads=None):
+    """运行选定分组的全部负载，返回可直接序列化为JSON的结果"""
+    results = []
+    for workload in workloads or default_workloads():
+        if groups and workload.group not in groups:
+            continue
+        for n in sizes:
+            if workload.max_size and n > workload.max_size:
+                continue
+            try:
+                results.append(run_workload(workload, n, seed))
+            except RecursionError:
+                # 例如有序键插入递归实现的二叉搜索树，深度达到 n
+                results.append({"group": workload.group, "workload": workload.name,
+                                "impl": workload.impl, "size": n, "error": "RecursionError"})
+    return {
+        "meta": {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "seed": seed,
+            "sizes": list(sizes),
+        },
+        "results": results,
+    }
+
+
+def print_results(report):
+    print(f"{'group':<12} {'workload':<16} {'impl':<24} {'size':>8} {'ops/s':>12} "
+          f"{'p50':>8} {'p99':>9} {'peak mem':>10}")
+    for row in report["results"]:
+        head = f"{row['group']:<12} {row['workload']:<16} {row['impl']:<24} {row['size']:>8}"
+        if "error" in row:
+            print(f"{head} {row['error']:>12}")
+            continue
+        lat = row["latency_ns"]
+        print(f"{head} {row['ops_per_sec']:>12,.0f} {lat['p50']:>6}ns {lat['p99']:>7}ns "
+              f"{row['peak_memory_bytes'] / 1024:>8.0f}KB")
+
+
+def compare(baseline, report, threshold=0.10):
+    """与之前保存的结果比较，返回吞吐量变化超过 threshold 的条目"""
+    def key(row):
+        return row["group"], row["workload"], row["impl"], row["size"]
+    old = {key(row): row for row in baseline["results"] if "error" not in row}
+    changes = []
+    for row in report["results"]:
+        before = old.get(key(row))
+        if "error" in row or before is None:
+            continue
+        ratio = row["ops_per_sec"] / before["ops_per_sec"]
+        if abs(ratio - 1) > threshold:
+            changes.append({"key": list(key(row)), "ratio": ratio})
+    return changes
+
+
+def time_call(func, repeat=3):
+    """多次调用func，返回最短耗时（秒）"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def sort_inputs(n, seed=0):
+    """生成排序基准使用的各类输入（含快速排序的退化输入）"""
+    rng = random.Random(seed)
+    half = n // 2
+    return {
+        "random": [rng.random() for _ in range(n)],
+        "sorted": list(range(n)),
+        "reversed": list(range(n, 0, -1)),
+        "few_unique": [rng.randint(0, 4) for _ in range(n)],
+        "all_equal": [7] * n,
+        "organ_pipe": list(range(half)) + list(range(n - half, 0, -1)),
+        "sawtooth": [i % 64 for i in range(n)],
+    }
+
+
+def bench_sorting(sizes=(1000, 10000, 100000), bubble_limit=2000, repeat=3):
+    """对比 quick_sort、bubble_sort 与内置 sorted 在各类输入上的耗时"""
+    results = []
+    for n in sizes:
+        for name, data in sort_inputs(n).items():
+            arr = ArrayOperations()
+            arr.extend(data)
+            row = {
+                "size": n,
+                "input": name,
+                "quick_sort": time_call(arr.quick_sort, repeat),
+                "sorted": time_call(lambda: sorted(data), repeat),
+                "bubble_sort": None,
+            }
+            if n <= bubble_limit:
+                def bubble():
+                    arr.data[:] = data
+                    arr.bubble_sort()
+                row["bubble_sort"] = time_call(bubble, 1)
+            results.append(row)
+    return results
+
+
+def print_sorting(results):
+    print(f"{'size':>8} {'input':<12} {'quick_sort':>12} {'sorted':>12} {'bubble_sort':>12}")
+    for row in results:
+        bubble = row["bubble_sort"]
+        bubble = f"{bubble * 1000:10.2f}ms" if bubble is not None else f"{'-':>12}"
+        print(f"{row['size']:>8} {row['input']:<12} "
+              f"{row['quick_sort'] * 1000:10.2f}ms {row['sorted'] * 1000:10.2f}ms {bubble}")
+
+
+def bench_linked_sort(sizes=(1000, 10000, 100000), repeat=3,
+                      inputs=("random", "sorted", "reversed", "few_unique")):
+    """链表原地归并排序对比：复制到 ArrayOperations 排序后再建链表，以及内置 sorted"""
+    def sort_in_place(factory, data):
+        best = float("inf")
+        for _ in range(repeat):
+            ll = factory()
+            for v in data:
+                ll.append(v)
+            start = time.perf_counter()
+            ll.sort()
+            best = min(best, time.perf_counter() - start)
+        return best
+    
+    def via_array(data):
+        ll = LinkedList()
+        ll.extend(data)
+        
+        def run():
+            arr = ArrayOperations()
+            arr.extend(ll)
+            LinkedList().extend(arr.quick_sort())
+        return time_call(run, repeat)
+    
+    results = []
+    for n in sizes:
+        all_inputs = sort_inputs(n)
+        for name in inputs:
+            data = all_inputs[name]
+            results.append({
+                "size": n,
+                "input": name,
+                "LinkedList.sort": sort_in_place(LinkedList, data),
+                "DoublyLinkedList.sort": sort_in_place(DoublyLinkedList, data),
+                "via_array": via_array(data),
+                "sorted": time_call(lambda: sorted(data), repeat),
+            })
+    return results
+
+
+def print_linked_sort(results):
+    columns = ("LinkedList.sort", "DoublyLinkedList.sort", "via_array", "sorted")
+    print(f"{'size':>8} {'input':<12} " + " ".join(f"{c:>22}" for c in columns))
+    for row in results:
+        print(f"{row['size']:>8} {row['input']:<12} "
+              + " ".join(f"{row[c] * 1000:20.2f}ms" for c in columns))
+
+
+def bench_snapshots(n=100000, snapshots=(10, 100)):
+    """读者快照的耗时和内存：复制 LinkedList.display() 对比持久化链表直接保留版本
+    
+    每次快照之前写入方先在头部加入一个元素
+    """
+    def copying(k):
+        ll = LinkedList()
+        ll.extend(range(n))
+        start = time.perf_counter()
+        kept = []
+        for i in range(k):
+            ll.prepend(i)
+            kept.append(ll.display())
+        return time.perf_counter() - start, kept
+    
+    def persistent(k):
+        version = PersistentLinkedList(range(n))
+        start = time.perf_counter()
+        kept = []
+        for i in range(k):
+            version = version.prepend(i)
+            kept.append(version)
+        return time.perf_counter() - start, kept
+    
+    results = []
+    for k in snapshots:
+        for mode, func in (("copy_display", copying), ("persistent", persistent)):
+            tracemalloc.start()
+            seconds, kept = func(k)
+            size, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            del kept
+            results.append({"size": n, "snapshots": k, "mode": mode,
+                            "seconds": seconds, "bytes": size})
+    return results
+
+
+def print_snapshots(results):
+    print(f"{'size':>8} {'snapshots':>9} {'mode':<14} {'time':>12} {'memory':>10}")
+    for row in results:
+        print(f"{row['size']:>8} {row['snapshots']:>9} {row['mode']:<14} "
+              f"{row['seconds'] * 1000:10.2f}ms {row['bytes'] / 1024:8.0f}KB")
+
+
+def stress_concurrent(threads=8, ops=5000, seed=SEED):
+    """多线程压力测试 ConcurrentDoublyLinkedList，检查结束后的结构不变式
+    
+    每个线程混合执行两端入队/出队、按值删除和遍历，插入的值各不相同；
+    调小线程切换间隔以增加指针更新之间被打断的机会。
+    失败时抛出 AssertionError，成功时返回统计信息。
+    """
+    dll = ConcurrentDoublyLinkedList()
+    inserted = [set() for _ in range(threads)]
+    removed = [[] for _ in range(threads)]
+    
+    def worker(tid):
+        rng = random.Random(seed + tid)
+        for i in range(ops):
+            val = tid * ops + i
+            op = rng.random()
+            if op < 0.3:
+                dll.append(val)
+                inserted[tid].add(val)
+            elif op < 0.6:
+                dll.prepend(val)
+                inserted[tid].add(val)
+            elif op < 0.7:
+                try:
+                    removed[tid].append(dll.pop_front())
+                except IndexError:
+                    pass
+            elif op < 0.8:
+                try:
+                    removed[tid].append(dll.pop_back())
+                except IndexError:
+                    pass
+            elif op < 0.95:
+                target = rng.choice(tuple(inserted[tid])) if inserted[tid] else -1
+                if dll.delete(target):
+                    removed[tid].append(target)
+            else:
+                for _ in itertools.islice(dll, 100):
+                    pass
+    
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        pool = [threading.Thread(target=worker, args=(t,)) for t in range(threads)]
+        for t in pool:
+            t.start()
+        for t in pool:
+            t.join()
+    finally:
+        sys.setswitchinterval(interval)
+    
+    forward = dll.display_forward()
+    all_inserted = set().union(*inserted)
+    all_removed = [v for r in removed for v in r]
+    assert forward == dll.display_backward()[::-1], "prev/next pointers disagree"
+    assert len(forward) == len(set(forward)) == len(dll), "size or duplicate mismatch"
+    assert len(all_removed) == len(set(all_removed)), "a value was removed twice"
+    assert set(forward) == all_inserted - set(all_removed), "values lost or resurrected"
+    node = dll.head
+    while node.next:
+        assert node.next.prev is node and not node.next.removed
+        node = node.next
+    return {"threads": threads, "ops": threads * ops, "remaining": len(forward),
+            "removed": len(all_removed)}
+
+
+def bench_concurrent(thread_counts=(1, 2, 4, 8), ops=200000):
+    """ConcurrentDoublyLinkedList 从1到N个线程的吞吐量（总操作数固定）
+    
+    一半线程在尾部追加、一半在头部插入，随后同样地从两端弹出；
+    有GIL的解释器上不会随线程数提升，自由线程（free-threaded）版本上才能体现细粒度锁的作用
+    """
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    results = []
+    for count in thread_counts:
+        dll = ConcurrentDoublyLinkedList()
+        per_thread = ops // count
+        
+        def worker(tid):
+            push = dll.append if tid % 2 == 0 else dll.prepend
+            pop = dll.pop_back if tid % 2 == 0 else dll.pop_front
+            for i in range(per_thread):
+                push(i)
+            for _ in range(per_thread):
+                pop()
+        
+        pool = [threading.Thread(target=worker, args=(t,)) for t in range(count)]
+        start = time.perf_counter()
+        for t in pool:
+            t.start()
+        for t in pool:
+            t.join()
+        seconds = time.perf_counter() - start
+        results.append({"threads": count, "ops": 2 * per_thread * count, "seconds": seconds,
+                        "ops_per_sec": 2 * per_thread * count / seconds, "gil": gil})
+    return results
+
+
+def print_concurrent(results):
+    print(f"{'threads':>8} {'ops':>9} {'time':>10} {'ops/s':>12}  (GIL: {results[0]['gil']})")
+    for row in results:
+        print(f"{row['threads']:>8} {row['ops']:>9} {row['seconds']:9.3f}s "
+              f"{row['ops_per_sec']:12,.0f}")
+
+
+def bench_expression(rows=100000, expression="-x^2 + 2.5*(y - 10) / (z + 1)", repeat=3):
+    """同一公式对大量变量绑定求值：每行重新解析、编译后逐行求值、按列批量求值
+    
+    每行重新解析的方式只在前 1/10 的行上计时，结果按每行耗时比较
+    """
+    rng = random.Random(0)
+    columns = {name: [rng.uniform(-10, 10) for _ in range(rows)] for name in "xyz"}
+    bindings = [dict(zip("xyz", row)) for row in zip(*columns.values())]
+    
+    def reparse(part):
+        for env in part:
+            tokens = StackApplications.tokenize(expression)
+            CompiledExpression(expression, StackApplications.tokens_to_postfix(tokens))(env)
+    
+    def per_row():
+        program = StackApplications.compile_expression(expression)
+        for env in bindings:
+            program(env)
+    
+    sample = bindings[:max(1, rows // 10)]
+    timings = {
+        "reparse_per_row": time_call(lambda: reparse(sample), repeat) / len(sample),
+        "compiled_per_row": time_call(per_row, repeat) / rows,
+        "evaluate_batch": time_call(
+            lambda: StackApplications.evaluate_batch(expression, columns), repeat) / rows,
+    }
+    return [{"rows": rows, "mode": mode, "ns_per_row": seconds * 1e9}
+            for mode, seconds in timings.items()]
+
+
+def print_expression(results):
+    print(f"{'rows':>9} {'mode':<18} {'per row':>10}")
+    for row in results:
+        print(f"{row['rows']:>9} {row['mode']:<18} {row['ns_per_row']:8.0f}ns")
+
+
+def bench_brackets(megabytes=16, workers=None):
+    """括号检查：整串读入内存 vs 流式分块 vs 多进程归约，输入为生成的类JSON文件"""
+    record = json.dumps({"id": 1, "tags": ["a", "b"], "pos": {"x": [1, 2, 3], "y": (4, 5)}})
+    line = ("[" + ", ".join([record] * 20) + "],\n").encode()
+    repeat = megabytes * (1 << 20) // len(line)
+    workers = workers or os.cpu_count() or 1
+    
+    fd, path = tempfile.mkstemp(suffix=".json")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(b"[")
+            for _ in range(repeat):
+                f.write(line)
+            f.write(b"[]]")
+        size = os.path.getsize(path)
+        
+        def whole():
+            with open(path, encoding="utf-8") as f:
+                return StackApplications.is_balanced_parentheses(f.read())
+        
+        modes = [
+            ("whole_string", whole),
+            ("streaming", lambda: StackApplications.find_bracket_mismatch(path)),
+            (f"parallel({workers})",
+             lambda: StackApplications.find_bracket_mismatch_parallel(path, workers)),
+        ]
+        results = []
+        for mode, func in modes:
+            seconds = time_call(func, 1)
+            tracemalloc.start()  # 单独再运行一次统计峰值内存，避免影响计时
+            func()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            results.append({"bytes": size, "mode": mode, "seconds": seconds,
+                            "mb_per_sec": size / seconds / (1 << 20), "peak_bytes": peak})
+        return results
+    finally:
+        os.remove(path)
+
+
+def print_brackets(results):
+    print(f"{'size':>8} {'mode':<14} {'time':>9} {'throughput':>12} {'peak mem':>10}")
+    for row in results:
+        print(f"{row['bytes'] >> 20:>6}MB {row['mode']:<14} {row['seconds']:8.2f}s "
+              f"{row['mb_per_sec']:8.1f}MB/s {row['peak_bytes'] >> 10:8}KB")
+
+
+def bench_stack_storm(ops=10000000, depth=1000, batch=100):
+    """入栈/出栈风暴：反复压入 depth 个元素再全部弹出，共 ops 次操作
+    
+    逐个操作对比 ArrayStack、LinkedStack、SegmentedArrayStack 和 list；
+    批量操作用 push_many/pop_many，每次 batch 个元素
+    """
+    rounds = max(1, ops // (2 * depth))
+    items = list(range(depth))
+    batches = [items[i:i + batch] for i in range(0, depth, batch)]
+    
+    def single(factory, push_name, pop_name):
+        def run():
+            stack = factory()
+            push, pop = getattr(stack, push_name), getattr(stack, pop_name)
+            for _ in range(rounds):
+                for item in items:
+                    push(item)
+                for _ in items:
+                    pop()
+        return run
+    
+    def bulk():
+        stack = SegmentedArrayStack()
+        for _ in range(rounds):
+            for chunk in batches:
+                stack.push_many(chunk)
+            for chunk in batches:
+                stack.pop_many(len(chunk))
+    
+    modes = [
+        ("ArrayStack", single(ArrayStack, "push", "pop")),
+        ("LinkedStack", single(LinkedStack, "push", "pop")),
+        ("SegmentedArrayStack", single(SegmentedArrayStack, "push", "pop")),
+        (f"Segmented many({batch})", bulk),
+        ("list", single(list, "append", "pop")),
+    ]
+    total = rounds * 2 * depth
+    results = []
+    for name, func in modes:
+        seconds = time_call(func, 1)
+        results.append({"impl": name, "ops": total, "seconds": seconds,
+                        "ops_per_sec": total / seconds})
+    return results
+
+
+def print_stack_storm(results):
+    print(f"{'impl':<24} {'ops':>10} {'time':>9} {'ops/s':>14}")
+    for row in results:
+        print(f"{row['impl']:<24} {row['ops']:>10} {row['seconds']:8.2f}s "
+              f"{row['ops_per_sec']:14,.0f}")
+
+
+def bench_sliding_window(n=100000, windows=(100, 1000, 10000)):
+    """滚动 min/max/sum：两栈聚合队列对比每步对 deque 重新计算
+    
+    重新计算的方式只在前 1/10 的数据上计时，按每个元素的耗时比较
+    """
+    rng = random.Random(0)
+    samples = [rng.expovariate(1 / 50) for _ in range(n)]  # 模拟请求延迟（毫秒）
+    results = []
+    for window in windows:
+        def two_stacks():
+            agg = SlidingWindowAggregator(window=window)
+            for latency in samples:
+                agg.push(latency)
+                agg.aggregate()
+        
+        def recompute(part):
+            recent = deque(maxlen=window)
+            for latency in part:
+                recent.append(latency)
+                min(recent), max(recent), sum(recent)
+        
+        part = samples[:max(1, n // 10)]
+        results.append({"size": n, "window": window,
+                         "two_stacks": time_call(two_stacks, 1) / n,
+                         "recompute": time_call(lambda: recompute(part), 1) / len(part)})
+    return results
+
+
+def print_sliding_window(results):
+    print(f"{'size':>8} {'window':>7} {'two_stacks':>12} {'recompute':>12}")
+    for row in results:
+        print(f"{row['size']:>8} {row['window']:>7} {row['two_stacks'] * 1e9:10.0f}ns "
+              f"{row['recompute'] * 1e9:10.0f}ns")
+
+
+def bench_base_conversion(n=100000, bases=(2, 7, 36), digits=(10000, 100000)):
+    """进制转换：批量整数与超大整数两类负载，结果按每个整数（每次调用）的耗时比较
+    
+    栈实现的 decimal_to_binary 只在前 1/10 的整数上计时；超大整数与内置 str/int
+    对照时临时解除3.11起对十进制位数的限制
+    """
+    rng = random.Random(0)
+    numbers = [rng.getrandbits(64) - (1 << 63) for _ in range(n)]
+    results = []
+    for base in bases:
+        strings = to_base_many(numbers, base)
+        timings = {
+            "to_base_loop": time_call(lambda: [to_base(x, base) for x in numbers], 1) / n,
+            "to_base_many": time_call(lambda: to_base_many(numbers, base), 1) / n,
+            "from_base_many": time_call(lambda: from_base_many(strings, base), 1) / n,
+        }
+        if base == 2:
+            part = [abs(x) for x in numbers[:max(1, n // 10)]]
+            timings["decimal_to_binary"] = time_call(
+                lambda: [StackApplications.decimal_to_binary(x) for x in part], 1) / len(part)
+        results.extend({"case": f"{n} x int64, base {base}", "mode": mode, "seconds": seconds}
+                       for mode, seconds in timings.items())
+    
+    limit = sys.get_int_max_str_digits()
+    sys.set_int_max_str_digits(0)
+    try:
+        for size in digits:
+            big = rng.randrange(10 ** (size - 1), 10 ** size)
+            text = str(big)
+            timings = {
+                "str": time_call(lambda: str(big), 1),
+                "to_base": time_call(lambda: to_base(big, 10), 1),
+                "int": time_call(lambda: int(text), 1),
+                "from_base": time_call(lambda: from_base(text, 10), 1),
+            }
+            results.extend({"case": f"{size} digits, base 10", "mode": mode, "seconds": seconds}
+                           for mode, seconds in timings.items())
+    finally:
+        sys.set_int_max_str_digits(limit)
+    return results
+
+
+def print_base_conversion(results):
+    print(f"{'case':<26} {'mode':<18} {'time':>12}")
+    for row in results:
+        print(f"{row['case']:<26} {row['mode']:<18} {row['seconds'] * 1e6:10.3f}us")
+
+
+def bench_append_scaling(sizes=(10000, 100000, 1000000), repeat=1):
+    """LinkedList 追加 n 个元素的总耗时与每元素耗时，用于确认随 n 线性增长"""
+    def append_all(n):
+        ll = LinkedList()
+        for i in range(n):
+            ll.append(i)
+    
+    def extend_all(n):
+        LinkedList().extend(range(n))
+    
+    results = []
+    for n in sizes:
+        for mode, func in (("append", append_all), ("extend", extend_all)):
+            seconds = time_call(lambda: func(n), repeat)
+            results.append({"size": n, "mode": mode, "seconds": seconds,
+                            "ns_per_item": seconds * 1e9 / n})
+    return results
+
+
+def print_append_scaling(results):
+    print(f"{'size':>9} {'mode':<8} {'time':>10} {'per item':>10}")
+    for row in results:
+        print(f"{row['size']:>9} {row['mode']:<8} {row['seconds']:9.3f}s "
+              f"{row['ns_per_item']:8.0f}ns")
+
+
+def bench_unrolled(n=100000, block_sizes=(16, 64, 256), repeat=3):
+    """对比展开链表与逐节点链表的内存占用和遍历耗时
+    
+    内存为 tracemalloc 统计的构建 n 个整数时的净分配量，
+    遍历分别测正向转列表和查找不存在的值（完整扫描一遍）
+    """
+    candidates = [("LinkedList", LinkedList, LinkedList.display),
+                  ("DoublyLinkedList", DoublyLinkedList, DoublyLinkedList.display_forward)]
+    for b in block_sizes:
+        candidates.append((f"Unrolled({b})", lambda b=b: UnrolledLinkedList(b),
+                           UnrolledLinkedList.display_forward))
+    values = list(range(n))
+    results = []
+    for name, factory, traverse in candidates:
+        tracemalloc.start()
+        structure = factory()
+        for v in values:
+            structure.append(v)
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        find = getattr(structure, "find", None)
+        results.append({
+            "impl": name, "size": n,
+            "bytes_per_element": size / n,
+            "traverse": time_call(lambda: traverse(structure), repeat),
+            "find_missing": time_call(lambda: find(-1), repeat) if find else None,
+        })
+    return results
+
+
+def print_unrolled(results):
+    print(f"{'impl':<18} {'bytes/elem':>10} {'traverse':>12} {'find miss':>12}")
+    for row in results:
+        find = (f"{row['find_missing'] * 1000:10.2f}ms" if row["find_missing"] is not None
+                else f"{'-':>12}")
+        print(f"{row['impl']:<18} {row['bytes_per_element']:10.1f} "
+              f"{row['traverse'] * 1000:10.2f}ms {find}")
+
+
+def _traced_bytes(build):
+    """build() 执行期间净分配的字节数（对象保持存活直到测量结束）"""
+    tracemalloc.start()
+    keep = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del keep
+    return size
+
+
+def bench_node_memory(n=100000):
+    """各模块节点类每个节点的内存：带 __dict__ 的普通类（改造前）对比 __slots__ 版本
+    
+    改造前的版本用同一个 __init__ 动态生成一个不带 __slots__ 的类来模拟
+    """
+    nodes = [
+        ("linked_list", ListNode, lambda cls, i: cls(i)),
+        ("linked_list", DoublyListNode, lambda cls, i: cls(i)),
+        ("linked_list", SkipListNode, lambda cls, i: cls(i, 1)),
+        ("linked_list", UnrolledNode, lambda cls, i: cls()),
+        ("stack", StackNode, lambda cls, i: cls(i)),
+        ("queue", QueueNode, lambda cls, i: cls(i)),
+        ("binary_tree", TreeNode, lambda cls, i: cls(i)),
+        ("hash_table", HashNode, lambda cls, i: cls(i, i)),
+    ]
+    values = list(range(n))  # 预先创建值对象，只统计节点本身
+    results = []
+    for module, cls, make in nodes:
+        plain = type(cls.__name__, (), {"__init__": cls.__init__})
+        before = _traced_bytes(lambda: [make(plain, i) for i in values])
+        after = _traced_bytes(lambda: [make(cls, i) for i in values])
+        results.append({"module": module, "node": cls.__name__,
+                        "before": before / n, "after": after / n})
+    
+    # 节点池：对比整条 LinkedList（已是 __slots__ 节点）与 PooledLinkedList
+    def build(factory):
+        ll = factory()
+        ll.extend(values)
+        return ll
+    results.append({"module": "linked_list", "node": "NodePool",
+                    "before": _traced_bytes(lambda: build(LinkedList)) / n,
+                    "after": _traced_bytes(lambda: build(PooledLinkedList)) / n})
+    return results
+
+
+def print_node_memory(results):
+    print(f"{'module':<12} {'node':<16} {'before':>10} {'after':>10} {'saved':>7}")
+    for row in results:
+        print(f"{row['module']:<12} {row['node']:<16} {row['before']:8.1f}B "
+              f"{row['after']:8.1f}B {1 - row['after'] / row['before']:6.0%}")
+
+
+def bench_parallel_sort(n=1000000, workers=None, typecode="q", repeat=1):
+    """测量 parallel_sort 相对单进程 quick_sort 的加速比"""
+    workers = workers or sorted({1, 2, 4, os.cpu_count() or 1})
+    rng = random.Random(0)
+    arr = ArrayOperations(typecode=typecode)
+    arr.extend(rng.randrange(-2 ** 40, 2 ** 40) for _ in range(n))
+    baseline = time_call(arr.quick_sort, repeat)
+    results = [{"size": n, "workers": 1, "mode": "quick_sort",
+                "seconds": baseline, "speedup": 1.0}]
+    for w in workers:
+        if w <= 1:
+            continue
+        seconds = time_call(lambda: arr.parallel_sort(workers=w, min_chunk=1), repeat)
+        results.append({"size": n, "workers": w, "mode": "parallel_sort",
+                        "seconds": seconds, "speedup": baseline / seconds})
+    return results
+
+
+def print_parallel_sort(results):
+    print(f"{'size':>9} {'workers':>8} {'mode':<14} {'time':>10} {'speedup':>8}")
+    for row in results:
+        print(f"{row['size']:>9} {row['workers']:>8} {row['mode']:<14} "
+              f"{row['seconds']:9.2f}s {row['speedup']:7.2f}x")
+
+
+def main(argv=None):
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description="数据结构性能基准测试")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="每个负载的规模（操作次数）")
+    parser.add_argument("--only", default=None,
+                        help="逗号分隔的分组名，可选：array,linked_list,lru_cache,stack,queue,bst,"
+                             "hash_table,sorting,linked_sort,parallel_sort,append_scaling,unrolled,"
+                             "node_memory,snapshots,concurrent,expression,brackets,"
+                             "stack_storm,sliding_window,base_conversion")
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--json", default=None, help="结果写入的JSON文件")
+    parser.add_argument("--baseline", default=None, help="用于比较回归的旧JSON结果")
+    args = parser.parse_args(argv)
+    
+    groups = set(args.only.split(",")) if args.only else None
+    report = run_suite(args.sizes, groups, args.seed)
+    print_results(report)
+    
+    if groups is None or "sorting" in groups:
+        report["sorting"] = bench_sorting(sizes=args.sizes)
+        print("\n=== 排序基准 ===")
+        print_sorting(report["sorting"])
+    if groups and "linked_sort" in groups:
+        report["linked_sort"] = bench_linked_sort(sizes=args.sizes)
+        print("\n=== 链表排序基准 ===")
+        print_linked_sort(report["linked_sort"])
+    if groups and "snapshots" in groups:
+        report["snapshots"] = bench_snapshots(n=max(args.sizes))
+        print("\n=== 快照基准 ===")
+        print_snapshots(report["snapshots"])
+    if groups and "concurrent" in groups:
+        stats = stress_concurrent()
+        print(f"\n=== 并发双向链表压力测试通过：{stats['threads']}个线程，"
+              f"{stats['ops']}次操作，剩余{stats['remaining']}个元素 ===")
+        report["concurrent"] = bench_concurrent()
+        print_concurrent(report["concurrent"])
+    if groups and "expression" in groups:
+        report["expression"] = bench_expression(rows=max(args.sizes))
+        print("\n=== 表达式求值基准 ===")
+        print_expression(report["expression"])
+    if groups and "brackets" in groups:
+        report["brackets"] = bench_brackets()
+        print("\n=== 括号检查基准 ===")
+        print_brackets(report["brackets"])
+    if groups and "stack_storm" in groups:
+        report["stack_storm"] = bench_stack_storm()
+        print("\n=== 栈入栈/出栈风暴 ===")
+        print_stack_storm(report["stack_storm"])
+    if groups and "sliding_window" in groups:
+        report["sliding_window"] = bench_sliding_window(n=max(args.sizes))
+        print("\n=== 滑动窗口聚合（每个元素的耗时） ===")
+        print_sliding_window(report["sliding_window"])
+    if groups and "base_conversion" in groups:
+        report["base_conversion"] = bench_base_conversion(n=max(args.sizes))
+        print("\n=== 进制转换（每个整数/每次调用的耗时） ===")
+        print_base_conversion(report["base_conversion"])
+    if groups and "append_scaling" in groups:
+        report["append_scaling"] = bench_append_scaling()
+        print("\n=== LinkedList 追加规模测试 ===")
+        print_append_scaling(report["append_scaling"])
+    if groups and "unrolled" in groups:
+        report["unrolled"] = bench_unrolled(n=max(args.sizes))
+        print("\n=== 展开链表内存与遍历对比 ===")
+        print_unrolled(report["unrolled"])
+    if groups and "node_memory" in groups:
+        report["node_memory"] = bench_node_memory(n=max(args.sizes))
+        print("\n=== 每个节点的内存（含列表中的引用槽位） ===")
+        print_node_memory(report["node_memory"])
+    if groups and "parallel_sort" in groups:
+        report["parallel_sort"] = bench_parallel_sort(n=max(args.sizes))
+        print(f"\n=== 并行排序基准（CPU核数: {os.cpu_count()}）===")
+        print_parallel_sort(report["parallel_sort"])
+    
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            changes = compare(json.load(f), report)
+        print("\n=== 与基线相比吞吐量变化超过10%的负载 ===")
+        for change in changes:
+            print(f"   {'/'.join(map(str, change['key']))}: {change['ratio']:.2f}x")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,8 @@
 
 class TreeNode:
     """二叉树节点"""
+    __slots__ = ("val", "left", "right")
+    
     def __init__(self, val=0):
         self.val = val
         self.left = None
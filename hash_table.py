@@ -5,6 +5,8 @@
 
 class HashNode:
     """哈希表节点（用于链地址法）"""
+    __slots__ = ("key", "value", "next")
+    
     def __init__(self, key, value):
         self.key = key
         self.value = value
@@ -3,42 +3,170 @@
 包含单向链表和双向链表的基本操作
 """
 
+import itertools
+import math
+import operator
+import random
+import sys
+import threading
+from array import array
+
+
 class ListNode:
     """链表节点"""
+    __slots__ = ("val", "next")
+    
     def __init__(self, val=0):
         self.val = val
         self.next = None
 
 class DoublyListNode:
     """双向链表节点"""
+    __slots__ = ("val", "next", "prev")
+    
     def __init__(self, val=0):
         self.val = val
         self.next = None
         self.prev = None
 
+def iter_reversed(owner, head, size, field):
+    """反向迭代单向链：先每隔约√n个节点记录一个检查点，再从后往前逐段输出
+    
+    额外内存O(√n)，时间O(n)。owner 需要维护修改计数 _mods，
+    迭代期间发生结构性修改时抛出 RuntimeError。
+    """
+    mods = owner._mods
+    step = max(1, math.isqrt(size))
+    checkpoints = []
+    node = head
+    index = 0
+    while node:
+        if index % step == 0:
+            checkpoints.append(node)
+        node = node.next
+        index += 1
+    
+    for start in reversed(checkpoints):
+        segment = []
+        node = start
+        while node and len(segment) < step:
+            segment.append(getattr(node, field))
+            node = node.next
+        for val in reversed(segment):
+            yield val
+            if owner._mods != mods:
+                raise RuntimeError(f"{type(owner).__name__} modified during iteration")
+
+
+def _before(key, reverse):
+    """返回 before(a, b)：a 是否必须排在 b 前面；相等时返回 False 以保持稳定"""
+    compare = operator.gt if reverse else operator.lt
+    if key is None:
+        return compare
+    return lambda a, b: compare(key(a), key(b))
+
+
+def _cut(node, count):
+    """在 node 之后第 count 个节点处断开，返回后半段的头节点"""
+    for _ in range(count - 1):
+        if node is None:
+            return None
+        node = node.next
+    if node is None:
+        return None
+    rest = node.next
+    node.next = None
+    return rest
+
+
+def _merge_chains(left, right, tail, before):
+    """把两条有序链合并后接到 tail 之后，返回合并结果的尾节点（只修改 next）"""
+    while left and right:
+        if before(right.val, left.val):
+            tail.next = right
+            right = right.next
+        else:
+            tail.next = left
+            left = left.next
+        tail = tail.next
+    tail.next = left or right
+    while tail.next:
+        tail = tail.next
+    return tail
+
+
+def _merge_sort_chain(head, size, before):
+    """自底向上归并排序一条单向链，返回新的 (head, tail)
+    
+    每一轮把相邻的两段长度为 step 的有序段合并，step 从1开始倍增，
+    只重新链接已有节点，不递归，除一个哨兵节点外不分配内存
+    """
+    dummy = ListNode()
+    dummy.next = head
+    tail = head
+    step = 1
+    while step < size:
+        tail = dummy
+        current = dummy.next
+        while current:
+            left = current
+            right = _cut(left, step)
+            current = _cut(right, step)
+            tail = _merge_chains(left, right, tail, before)
+        step *= 2
+    return dummy.next, tail
+
+
 class LinkedList:
-    """单向链表"""
+    """单向链表
+    
+    支持 for 循环、reversed()、len() 和 in；迭代是惰性的，
+    迭代期间修改链表会抛出 RuntimeError。
+    """
     def __init__(self):
         self.head = None
+        self.tail = None
         self.size = 0
+        self._mods = 0
     
     def append(self, val):
         """在链表末尾添加节点"""
+        self._mods += 1
         new_node = ListNode(val)
         if not self.head:
             self.head = new_node
         else:
-            current = self.head
-            while current.next:
-                current = current.next
-            current.next = new_node
+            self.tail.next = new_node
+        self.tail = new_node
         self.size += 1
     
+    def extend(self, values):
+        """把可迭代对象中的元素依次链接到链表末尾"""
+        self._mods += 1
+        dummy = ListNode()
+        last = dummy
+        count = 0
+        for val in values:
+            last.next = ListNode(val)
+            last = last.next
+            count += 1
+        if count == 0:
+            return
+        if self.head:
+            self.tail.next = dummy.next
+        else:
+            self.head = dummy.next
+        self.tail = last
+        self.size += count
+    
     def prepend(self, val):
         """在链表头部添加节点"""
+        self._mods += 1
         new_node = ListNode(val)
         new_node.next = self.head
         self.head = new_node
+        if self.tail is None:
+            self.tail = new_node
         self.size += 1
     
     def insert(self, index, val):
@@ -49,7 +177,11 @@ class LinkedList:
         if index == 0:
             self.prepend(val)
             return
+        if index == self.size:
+            self.append(val)
+            return
         
+        self._mods += 1
         new_node = ListNode(val)
         current = self.head
         for i in range(index - 1):
@@ -65,13 +197,19 @@ class LinkedList:
             return False
         
         if self.head.val == val:
+            self._mods += 1
             self.head = self.head.next
+            if self.head is None:
+                self.tail = None
             self.size -= 1
             return True
         
         current = self.head
         while current.next:
             if current.next.val == val:
+                self._mods += 1
+                if current.next is self.tail:
+                    self.tail = current
                 current.next = current.next.next
                 self.size -= 1
                 return True
@@ -83,8 +221,11 @@ class LinkedList:
         if index < 0 or index >= self.size:
             raise IndexError("Index out of range")
         
+        self._mods += 1
         if index == 0:
             self.head = self.head.next
+            if self.head is None:
+                self.tail = None
             self.size -= 1
             return
         
@@ -92,6 +233,8 @@ class LinkedList:
         for i in range(index - 1):
             current = current.next
         
+        if current.next is self.tail:
+            self.tail = current
         current.next = current.next.next
         self.size -= 1
     
@@ -118,8 +261,10 @@ class LinkedList:
     
     def reverse(self):
         """反转链表"""
+        self._mods += 1
         prev = None
         current = self.head
+        self.tail = current
         
         while current:
             next_temp = current.next
@@ -129,14 +274,55 @@ class LinkedList:
         
         self.head = prev
     
-    def display(self):
-        """显示链表内容"""
-        result = []
+    def sort(self, key=None, reverse=False):
+        """原地稳定排序（自底向上归并排序），O(n log n)"""
+        if self.size <= 1:
+            return
+        self._mods += 1
+        self.head, self.tail = _merge_sort_chain(self.head, self.size, _before(key, reverse))
+    
+    def merge_sorted(self, other, key=None, reverse=False):
+        """把同样有序的 other 线性合并进来，other 被清空；相等时当前链表的元素在前"""
+        if other is self:
+            raise ValueError("Cannot merge a list with itself")
+        if other.head is None:
+            return
+        self._mods += 1
+        other._mods += 1
+        dummy = ListNode()
+        self.tail = _merge_chains(self.head, other.head, dummy, _before(key, reverse))
+        self.head = dummy.next
+        self.size += other.size
+        other.head = other.tail = None
+        other.size = 0
+    
+    def __iter__(self):
+        """从头到尾惰性迭代链表中的值"""
+        mods = self._mods
         current = self.head
         while current:
-            result.append(current.val)
+            yield current.val
+            if self._mods != mods:
+                raise RuntimeError("LinkedList modified during iteration")
             current = current.next
-        return result
+    
+    def __reversed__(self):
+        """从尾到头迭代，额外内存O(√n)"""
+        return iter_reversed(self, self.head, self.size, "val")
+    
+    def __len__(self):
+        return self.size
+    
+    def __contains__(self, val):
+        return self.find(val) != -1
+    
+    def islice(self, start, stop=None):
+        """惰性切片：只遍历到 stop 为止"""
+        return itertools.islice(self, start, stop)
+    
+    def display(self):
+        """显示链表内容"""
+        return list(self)
     
     def is_empty(self):
         """检查链表是否为空"""
@@ -147,33 +333,169 @@ class LinkedList:
         return self.size
 
 class DoublyLinkedList:
-    """双向链表"""
+    """双向链表
+    
+    append/prepend/insert_after 返回新节点，节点可以作为句柄传给
+    remove_node/move_to_front/move_to_back/insert_after，均为O(1)。
+    句柄必须属于当前链表，且未被移除。
+    支持 for 循环、reversed()、len() 和 in，迭代期间修改链表会抛出 RuntimeError。
+    """
     def __init__(self):
         self.head = None
         self.tail = None
         self.size = 0
+        self._mods = 0
+    
+    def _link_node(self, node, prev, nxt):
+        """把 node 链接到 prev 与 nxt 之间（两者为 None 表示链表头/尾）"""
+        self._mods += 1
+        node.prev = prev
+        node.next = nxt
+        if prev:
+            prev.next = node
+        else:
+            self.head = node
+        if nxt:
+            nxt.prev = node
+        else:
+            self.tail = node
+    
+    def _unlink_node(self, node):
+        """把 node 从链表中摘下，不改变 size"""
+        self._mods += 1
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+        node.prev = node.next = None
     
     def append(self, val):
-        """在链表末尾添加节点"""
+        """在链表末尾添加节点，返回新节点"""
         new_node = DoublyListNode(val)
-        if not self.head:
-            self.head = self.tail = new_node
-        else:
-            new_node.prev = self.tail
-            self.tail.next = new_node
-            self.tail = new_node
+        self._link_node(new_node, self.tail, None)
         self.size += 1
+        return new_node
     
     def prepend(self, val):
-        """在链表头部添加节点"""
+        """在链表头部添加节点，返回新节点"""
         new_node = DoublyListNode(val)
-        if not self.head:
-            self.head = self.tail = new_node
-        else:
-            new_node.next = self.head
-            self.head.prev = new_node
-            self.head = new_node
+        self._link_node(new_node, None, self.head)
+        self.size += 1
+        return new_node
+    
+    def insert_after(self, node, val):
+        """在节点 node 之后插入新值，返回新节点"""
+        new_node = DoublyListNode(val)
+        self._link_node(new_node, node, node.next)
         self.size += 1
+        return new_node
+    
+    def remove_node(self, node):
+        """移除节点 node，返回其值"""
+        self._unlink_node(node)
+        self.size -= 1
+        return node.val
+    
+    def move_to_front(self, node):
+        """把节点 node 移到链表头部"""
+        if node is not self.head:
+            self._unlink_node(node)
+            self._link_node(node, None, self.head)
+    
+    def move_to_back(self, node):
+        """把节点 node 移到链表尾部"""
+        if node is not self.tail:
+            self._unlink_node(node)
+            self._link_node(node, self.tail, None)
+    
+    def _take_all(self, other):
+        """清空 other 并返回其 (head, tail, size)"""
+        if other is self:
+            raise ValueError("Cannot splice a list into itself")
+        chain = (other.head, other.tail, other.size)
+        other.head = other.tail = None
+        other.size = 0
+        other._mods += 1
+        return chain
+    
+    def splice(self, node, other):
+        """把 other 的全部节点整体接到节点 node 之后（node 为 None 时接到头部），O(1)
+        
+        other 被清空，其节点句柄转移到当前链表
+        """
+        first, last, count = self._take_all(other)
+        if first is None:
+            return
+        self._mods += 1
+        nxt = node.next if node else self.head
+        first.prev = node
+        last.next = nxt
+        if node:
+            node.next = first
+        else:
+            self.head = first
+        if nxt:
+            nxt.prev = last
+        else:
+            self.tail = last
+        self.size += count
+    
+    def concat(self, other):
+        """把 other 的全部节点接到末尾，O(1)，other 被清空"""
+        self.splice(self.tail, other)
+    
+    def split_at(self, node):
+        """从节点 node 处断开，node 及其后的节点作为新链表返回
+        
+        只修改断点处的指针；为维护两边的长度，从 node 向两端同时计数，
+        耗时O(min(k, n - k))
+        """
+        before, after, count = node.prev, node, 0
+        while before and after:
+            before, after = before.prev, after.next
+            count += 1
+        moved = count if after is None else self.size - count
+        
+        self._mods += 1
+        tail_list = DoublyLinkedList()
+        tail_list.head, tail_list.tail = node, self.tail
+        tail_list.size = moved
+        self.tail = node.prev
+        if node.prev:
+            node.prev.next = None
+        else:
+            self.head = None
+        node.prev = None
+        self.size -= moved
+        return tail_list
+    
+    def rotate(self, k=1):
+        """向右旋转 k 步（k 为负时向左），与 collections.deque.rotate 一致
+        
+        首尾相接后从较近的一端走到新的断点，耗时O(min(k, n - k))
+        """
+        if self.size <= 1:
+            return
+        k %= self.size
+        if k == 0:
+            return
+        self._mods += 1
+        if k <= self.size // 2:
+            new_head = self.tail
+            for _ in range(k - 1):
+                new_head = new_head.prev
+        else:
+            new_head = self.head
+            for _ in range(self.size - k):
+                new_head = new_head.next
+        self.tail.next = self.head
+        self.head.prev = self.tail
+        self.head, self.tail = new_head, new_head.prev
+        self.head.prev = self.tail.next = None
     
     def delete(self, val):
         """删除指定值的第一个节点"""
@@ -181,39 +503,1070 @@ class DoublyLinkedList:
         
         while current:
             if current.val == val:
-                if current.prev:
-                    current.prev.next = current.next
-                else:
-                    self.head = current.next
-                
-                if current.next:
-                    current.next.prev = current.prev
-                else:
-                    self.tail = current.prev
-                
-                self.size -= 1
+                self.remove_node(current)
                 return True
             current = current.next
         return False
     
+    def _relink_prev(self, head):
+        """按 next 指针重建 prev 指针和头尾"""
+        prev = None
+        node = head
+        while node:
+            node.prev = prev
+            prev = node
+            node = node.next
+        self.head, self.tail = head, prev
+    
+    def sort(self, key=None, reverse=False):
+        """原地稳定排序：先按 next 做自底向上归并排序，再一次遍历修复 prev"""
+        if self.size <= 1:
+            return
+        self._mods += 1
+        head, _ = _merge_sort_chain(self.head, self.size, _before(key, reverse))
+        self._relink_prev(head)
+    
+    def merge_sorted(self, other, key=None, reverse=False):
+        """把同样有序的 other 线性合并进来，other 被清空；相等时当前链表的元素在前"""
+        first, _, count = self._take_all(other)
+        if first is None:
+            return
+        self._mods += 1
+        dummy = ListNode()
+        _merge_chains(self.head, first, dummy, _before(key, reverse))
+        self._relink_prev(dummy.next)
+        self.size += count
+    
+    def _iter_nodes(self, start, step):
+        mods = self._mods
+        current = start
+        while current:
+            yield current.val
+            if self._mods != mods:
+                raise RuntimeError("DoublyLinkedList modified during iteration")
+            current = getattr(current, step)
+    
+    def __iter__(self):
+        """从头到尾惰性迭代链表中的值"""
+        return self._iter_nodes(self.head, "next")
+    
+    def __reversed__(self):
+        """从尾到头惰性迭代链表中的值"""
+        return self._iter_nodes(self.tail, "prev")
+    
+    def __len__(self):
+        return self.size
+    
+    def __contains__(self, val):
+        return any(item == val for item in self)
+    
+    def islice(self, start, stop=None):
+        """惰性切片：只遍历到 stop 为止"""
+        return itertools.islice(self, start, stop)
+    
     def display_forward(self):
         """正向显示链表内容"""
+        return list(self)
+    
+    def display_backward(self):
+        """反向显示链表内容"""
+        return list(reversed(self))
+    
+    def length(self):
+        """获取链表长度"""
+        return self.size
+
+
+class LRUCache:
+    """有界LRU缓存：哈希表定位节点，双向链表维护最近使用顺序
+    
+    链表头部是最近使用的条目，尾部是最久未使用的条目，get/put 均为O(1)。
+    不指定 weigher 时 capacity 是条目数上限；指定时 capacity 是
+    weigher(key, value) 的总和上限。on_evict(key, value) 在条目被淘汰时调用。
+    """
+    def __init__(self, capacity, weigher=None, on_evict=None):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.weigher = weigher
+        self.on_evict = on_evict
+        self.map = {}
+        self.order = DoublyLinkedList()
+        self.weight = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def _weigh(self, key, value):
+        return self.weigher(key, value) if self.weigher else 1
+    
+    def get(self, key, default=None):
+        """读取条目并标记为最近使用，不存在时返回 default"""
+        node = self.map.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self.order.move_to_front(node)
+        return node.val[1]
+    
+    def put(self, key, value):
+        """写入条目并标记为最近使用，超出容量时从最久未使用的一端淘汰"""
+        weight = self._weigh(key, value)
+        if weight > self.capacity:
+            raise ValueError("Item weight exceeds cache capacity")
+        
+        node = self.map.get(key)
+        if node is not None:
+            self.weight -= node.val[2]
+            node.val = (key, value, weight)
+            self.order.move_to_front(node)
+        else:
+            self.map[key] = self.order.prepend((key, value, weight))
+        self.weight += weight
+        
+        while self.weight > self.capacity:
+            self._evict(self.order.tail)
+    
+    def _evict(self, node):
+        key, value, weight = self.order.remove_node(node)
+        del self.map[key]
+        self.weight -= weight
+        self.evictions += 1
+        if self.on_evict:
+            self.on_evict(key, value)
+    
+    def pop(self, key, default=None):
+        """删除条目并返回其值（不触发淘汰回调）"""
+        node = self.map.pop(key, None)
+        if node is None:
+            return default
+        _, value, weight = self.order.remove_node(node)
+        self.weight -= weight
+        return value
+    
+    def keys(self):
+        """按最近使用到最久未使用的顺序返回键"""
+        return [item[0] for item in self.order.display_forward()]
+    
+    def stats(self):
+        """命中/未命中/淘汰次数和命中率"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": len(self.map),
+            "weight": self.weight,
+        }
+    
+    def __contains__(self, key):
+        return key in self.map
+    
+    def __len__(self):
+        return len(self.map)
+
+
+class ConcurrentListNode:
+    """并发双向链表节点：每个节点自带一把锁和删除标记"""
+    __slots__ = ("val", "next", "prev", "lock", "removed")
+    
+    def __init__(self, val=None):
+        self.val = val
+        self.next = None
+        self.prev = None
+        self.lock = threading.Lock()
+        self.removed = False
+
+
+class ConcurrentDoublyLinkedList:
+    """线程安全的双向链表（细粒度锁，没有全局锁）
+    
+    头尾各有一个永不删除的哨兵节点。修改时只锁住涉及的相邻节点，
+    并且总是按从头到尾的顺序加锁以避免死锁；加锁后重新验证相邻关系，
+    验证失败说明期间有其他线程修改过，重试即可。
+    因此在两端入队的线程分别只竞争头哨兵和尾哨兵的锁。
+    
+    遍历不加锁：被删除的节点保留原来的 next/prev 指针并打上删除标记，
+    遍历时跳过它们。遍历结果是弱一致的快照，不会抛出 RuntimeError。
+    """
+    def __init__(self):
+        self.head = ConcurrentListNode()
+        self.tail = ConcurrentListNode()
+        self.head.next = self.tail
+        self.tail.prev = self.head
+        self._size = 0
+        self._size_lock = threading.Lock()
+    
+    def _add_size(self, delta):
+        with self._size_lock:
+            self._size += delta
+    
+    def _link_between(self, pred, succ, val):
+        """在已加锁的相邻节点 pred 与 succ 之间链接新节点"""
+        node = ConcurrentListNode(val)
+        node.prev = pred
+        node.next = succ
+        pred.next = node
+        succ.prev = node
+        return node
+    
+    def _unlink(self, pred, node, succ):
+        """摘除已加锁的 node，保留它自己的指针供并发遍历继续前进"""
+        node.removed = True
+        pred.next = succ
+        succ.prev = pred
+    
+    def append(self, val):
+        """在链表末尾添加节点"""
+        while True:
+            pred = self.tail.prev
+            with pred.lock, self.tail.lock:
+                if pred.removed or pred.next is not self.tail:
+                    continue
+                self._link_between(pred, self.tail, val)
+            self._add_size(1)
+            return
+    
+    def prepend(self, val):
+        """在链表头部添加节点"""
+        with self.head.lock:
+            succ = self.head.next
+            with succ.lock:
+                self._link_between(self.head, succ, val)
+        self._add_size(1)
+    
+    def pop_front(self):
+        """删除并返回头部元素"""
+        with self.head.lock:
+            node = self.head.next
+            if node is self.tail:
+                raise IndexError("List is empty")
+            with node.lock:
+                succ = node.next
+                with succ.lock:
+                    self._unlink(self.head, node, succ)
+        self._add_size(-1)
+        return node.val
+    
+    def pop_back(self):
+        """删除并返回尾部元素"""
+        while True:
+            node = self.tail.prev
+            if node is self.head:
+                raise IndexError("List is empty")
+            pred = node.prev
+            with pred.lock, node.lock, self.tail.lock:
+                if pred.removed or node.removed or pred.next is not node \
+                        or node.next is not self.tail:
+                    continue
+                self._unlink(pred, node, self.tail)
+            self._add_size(-1)
+            return node.val
+    
+    def _find_node(self, val):
+        node = self.head.next
+        while node is not self.tail:
+            if not node.removed and node.val == val:
+                return node
+            node = node.next
+        return None
+    
+    def delete(self, val):
+        """删除指定值的第一个节点"""
+        while True:
+            node = self._find_node(val)
+            if node is None:
+                return False
+            pred = node.prev
+            with pred.lock, node.lock:
+                if pred.removed or node.removed or pred.next is not node:
+                    continue
+                succ = node.next
+                with succ.lock:
+                    self._unlink(pred, node, succ)
+            self._add_size(-1)
+            return True
+    
+    def __iter__(self):
+        """无锁正向遍历（弱一致）"""
+        node = self.head.next
+        while node is not self.tail:
+            if not node.removed:
+                yield node.val
+            node = node.next
+    
+    def __reversed__(self):
+        """无锁反向遍历（弱一致）"""
+        node = self.tail.prev
+        while node is not self.head:
+            if not node.removed:
+                yield node.val
+            node = node.prev
+    
+    def __len__(self):
+        return self._size
+    
+    def __contains__(self, val):
+        return self._find_node(val) is not None
+    
+    def display_forward(self):
+        """正向显示链表内容"""
+        return list(self)
+    
+    def display_backward(self):
+        """反向显示链表内容"""
+        return list(reversed(self))
+    
+    def is_empty(self):
+        """检查链表是否为空"""
+        return self.head.next is self.tail
+    
+    def length(self):
+        """获取链表长度"""
+        return self._size
+
+
+class SkipListNode:
+    """可索引跳表节点：每一层保存后继指针和跨越的元素个数"""
+    __slots__ = ("val", "next", "width")
+    
+    def __init__(self, val, level):
+        self.val = val
+        self.next = [None] * level
+        self.width = [0] * level
+
+
+class SkipLinkedList:
+    """按位置索引的跳表，对外提供与 LinkedList 相同的接口
+    
+    每层指针记录跨度（跳过的元素个数），按位置访问、插入、删除
+    都能像二分一样逐层下降，期望复杂度 O(log n)。
+    按值查找/删除仍需顺序扫描，O(n)。
+    p 为节点晋升到上一层的概率：越大查找越快，额外指针也越多。
+    """
+    def __init__(self, p=0.5, max_level=32, seed=None):
+        if not 0 < p < 1:
+            raise ValueError("p must be between 0 and 1")
+        self.p = p
+        self.max_level = max_level
+        self._random = random.Random(seed)
+        self._reset()
+    
+    def _reset(self):
+        """清空为只有表头的空跳表"""
+        self.level = 1
+        self.size = 0
+        self._head = SkipListNode(None, self.max_level)
+    
+    def _random_level(self):
+        level = 1
+        while level < self.max_level and self._random.random() < self.p:
+            level += 1
+        return level
+    
+    def _predecessors(self, index):
+        """返回每层中位置小于 index 的最后一个节点及其位置（表头位置为-1）"""
+        update = [self._head] * self.max_level
+        positions = [-1] * self.max_level
+        node, pos = self._head, -1
+        for lvl in range(self.level - 1, -1, -1):
+            while node.next[lvl] is not None and pos + node.width[lvl] < index:
+                pos += node.width[lvl]
+                node = node.next[lvl]
+            update[lvl] = node
+            positions[lvl] = pos
+        return update, positions
+    
+    def append(self, val):
+        """在链表末尾添加节点"""
+        self.insert(self.size, val)
+    
+    def extend(self, values):
+        """把可迭代对象中的元素依次添加到末尾"""
+        for val in values:
+            self.insert(self.size, val)
+    
+    def prepend(self, val):
+        """在链表头部添加节点"""
+        self.insert(0, val)
+    
+    def insert(self, index, val):
+        """在指定位置插入节点"""
+        if index < 0 or index > self.size:
+            raise IndexError("Index out of range")
+        
+        update, positions = self._predecessors(index)
+        level = self._random_level()
+        if level > self.level:
+            for lvl in range(self.level, level):
+                # 新启用的层从表头直接指向末尾，跨度为全部元素
+                self._head.width[lvl] = self.size
+            self.level = level
+        
+        new_node = SkipListNode(val, level)
+        for lvl in range(level):
+            prev, prev_pos = update[lvl], positions[lvl]
+            new_node.next[lvl] = prev.next[lvl]
+            new_node.width[lvl] = prev_pos + prev.width[lvl] + 1 - index
+            prev.next[lvl] = new_node
+            prev.width[lvl] = index - prev_pos
+        for lvl in range(level, self.level):
+            update[lvl].width[lvl] += 1
+        self.size += 1
+    
+    def delete_at(self, index):
+        """删除指定位置的节点"""
+        if index < 0 or index >= self.size:
+            raise IndexError("Index out of range")
+        
+        update, _ = self._predecessors(index)
+        node = update[0].next[0]
+        for lvl in range(self.level):
+            if lvl < len(node.next):
+                update[lvl].next[lvl] = node.next[lvl]
+                update[lvl].width[lvl] += node.width[lvl] - 1
+            else:
+                update[lvl].width[lvl] -= 1
+        while self.level > 1 and self._head.next[self.level - 1] is None:
+            self.level -= 1
+        self.size -= 1
+        return node.val
+    
+    def delete(self, val):
+        """删除指定值的第一个节点"""
+        index = self.find(val)
+        if index == -1:
+            return False
+        self.delete_at(index)
+        return True
+    
+    def find(self, val):
+        """查找值，返回索引"""
+        current = self._head.next[0]
+        index = 0
+        while current:
+            if current.val == val:
+                return index
+            current = current.next[0]
+            index += 1
+        return -1
+    
+    def get(self, index):
+        """获取指定位置的值"""
+        if index < 0 or index >= self.size:
+            raise IndexError("Index out of range")
+        
+        update, _ = self._predecessors(index)
+        return update[0].next[0].val
+    
+    def reverse(self):
+        """反转链表（按逆序重建，O(n log n)）"""
+        values = self.display()
+        self._reset()
+        self.extend(reversed(values))
+    
+    def display(self):
+        """显示链表内容"""
         result = []
-        current = self.head
+        current = self._head.next[0]
         while current:
             result.append(current.val)
-            current = current.next
+            current = current.next[0]
+        return result
+    
+    def is_empty(self):
+        """检查链表是否为空"""
+        return self.size == 0
+    
+    def length(self):
+        """获取链表长度"""
+        return self.size
+    
+    def memory_usage(self):
+        """统计额外的指针开销：节点数、指针总数、平均层数和估算字节数"""
+        nodes = links = total_bytes = 0
+        current = self._head
+        while current:
+            nodes += 1
+            links += len(current.next)
+            total_bytes += (sys.getsizeof(current) + sys.getsizeof(current.next)
+                            + sys.getsizeof(current.width))
+            if hasattr(current, "__dict__"):
+                total_bytes += sys.getsizeof(current.__dict__)
+            current = current.next[0]
+        elements = nodes - 1
+        return {
+            "elements": elements,
+            "links": links - self.max_level,
+            "avg_level": (links - self.max_level) / elements if elements else 0.0,
+            "bytes": total_bytes,
+            "bytes_per_element": total_bytes / elements if elements else 0.0,
+        }
+
+
+class UnrolledNode:
+    """展开链表节点：一个节点保存最多 block_size 个值"""
+    __slots__ = ("values", "next", "prev")
+    
+    def __init__(self, values=None):
+        self.values = values if values is not None else []
+        self.next = None
+        self.prev = None
+
+
+class UnrolledLinkedList:
+    """展开链表（unrolled linked list）
+    
+    每个节点保存一段连续的值，节点满时对半分裂，删除后不足半满时
+    向后继借元素或与后继合并。相比每个值一个节点，指针和对象头的开销
+    被一整块值分摊，遍历时也只需每块跳转一次指针。
+    同时提供 LinkedList 和 DoublyLinkedList 的接口。
+    """
+    def __init__(self, block_size=64):
+        if block_size < 2:
+            raise ValueError("block_size must be at least 2")
+        self.block_size = block_size
+        self.head = None
+        self.tail = None
+        self.size = 0
+    
+    def _locate(self, index):
+        """返回第 index 个元素所在的节点及其在节点内的偏移"""
+        if index < self.size // 2:
+            node = self.head
+            while index >= len(node.values):
+                index -= len(node.values)
+                node = node.next
+            return node, index
+        node = self.tail
+        index = self.size - index
+        while index > len(node.values):
+            index -= len(node.values)
+            node = node.prev
+        return node, len(node.values) - index
+    
+    def _link_after(self, node, new_node):
+        """把 new_node 链接到 node 之后（node 为 None 时作为唯一节点）"""
+        if node is None:
+            self.head = self.tail = new_node
+            return
+        new_node.prev = node
+        new_node.next = node.next
+        if node.next:
+            node.next.prev = new_node
+        else:
+            self.tail = new_node
+        node.next = new_node
+    
+    def _unlink(self, node):
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+    
+    def append(self, val):
+        """在链表末尾添加元素"""
+        if self.tail is None or len(self.tail.values) >= self.block_size:
+            self._link_after(self.tail, UnrolledNode())
+        self.tail.values.append(val)
+        self.size += 1
+    
+    def extend(self, values):
+        """把可迭代对象中的元素依次添加到末尾，按块批量链接"""
+        values = list(values)
+        start = 0
+        if self.tail is not None:
+            start = self.block_size - len(self.tail.values)
+            self.tail.values.extend(values[:start])
+        for i in range(start, len(values), self.block_size):
+            self._link_after(self.tail, UnrolledNode(values[i:i + self.block_size]))
+        self.size += len(values)
+    
+    def prepend(self, val):
+        """在链表头部添加元素"""
+        self.insert(0, val)
+    
+    def insert(self, index, val):
+        """在指定位置插入元素，节点已满时对半分裂"""
+        if index < 0 or index > self.size:
+            raise IndexError("Index out of range")
+        if index == self.size:
+            self.append(val)
+            return
+        
+        node, offset = self._locate(index)
+        if len(node.values) >= self.block_size:
+            half = len(node.values) // 2
+            new_node = UnrolledNode(node.values[half:])
+            del node.values[half:]
+            self._link_after(node, new_node)
+            if offset > half:
+                node, offset = new_node, offset - half
+        node.values.insert(offset, val)
+        self.size += 1
+    
+    def delete_at(self, index):
+        """删除指定位置的元素并返回"""
+        if index < 0 or index >= self.size:
+            raise IndexError("Index out of range")
+        node, offset = self._locate(index)
+        val = node.values.pop(offset)
+        self.size -= 1
+        self._rebalance(node)
+        return val
+    
+    def delete(self, val):
+        """删除指定值的第一个元素"""
+        node = self.head
+        while node:
+            if val in node.values:
+                node.values.remove(val)
+                self.size -= 1
+                self._rebalance(node)
+                return True
+            node = node.next
+        return False
+    
+    def _rebalance(self, node):
+        """节点不足半满时与后继合并或从后继借元素，空节点直接摘除"""
+        if not node.values:
+            self._unlink(node)
+            return
+        nxt = node.next
+        if nxt is None or len(node.values) >= self.block_size // 2:
+            return
+        if len(node.values) + len(nxt.values) <= self.block_size:
+            node.values.extend(nxt.values)
+            self._unlink(nxt)
+        else:
+            move = (len(nxt.values) - len(node.values)) // 2
+            node.values.extend(nxt.values[:move])
+            del nxt.values[:move]
+    
+    def find(self, val):
+        """查找值，返回索引"""
+        node = self.head
+        base = 0
+        while node:
+            if val in node.values:
+                return base + node.values.index(val)
+            base += len(node.values)
+            node = node.next
+        return -1
+    
+    def get(self, index):
+        """获取指定位置的值"""
+        if index < 0 or index >= self.size:
+            raise IndexError("Index out of range")
+        node, offset = self._locate(index)
+        return node.values[offset]
+    
+    def reverse(self):
+        """反转链表：反转节点顺序和每个节点内的值"""
+        node = self.head
+        self.head, self.tail = self.tail, self.head
+        while node:
+            node.values.reverse()
+            node.next, node.prev = node.prev, node.next
+            node = node.prev
+    
+    def display(self):
+        """显示链表内容"""
+        return self.display_forward()
+    
+    def display_forward(self):
+        """正向显示链表内容"""
+        result = []
+        node = self.head
+        while node:
+            result.extend(node.values)
+            node = node.next
         return result
     
     def display_backward(self):
         """反向显示链表内容"""
         result = []
-        current = self.tail
-        while current:
-            result.append(current.val)
-            current = current.prev
+        node = self.tail
+        while node:
+            result.extend(reversed(node.values))
+            node = node.prev
         return result
     
+    def is_empty(self):
+        """检查链表是否为空"""
+        return self.size == 0
+    
+    def length(self):
+        """获取链表长度"""
+        return self.size
+    
+    def memory_usage(self):
+        """统计节点数和估算字节数（不含值对象本身）"""
+        nodes = total_bytes = 0
+        node = self.head
+        while node:
+            nodes += 1
+            total_bytes += sys.getsizeof(node) + sys.getsizeof(node.values)
+            if hasattr(node, "__dict__"):
+                total_bytes += sys.getsizeof(node.__dict__)
+            node = node.next
+        return {
+            "elements": self.size,
+            "nodes": nodes,
+            "bytes": total_bytes,
+            "bytes_per_element": total_bytes / self.size if self.size else 0.0,
+        }
+
+
+NIL = -1
+
+
+class NodePool:
+    """结构数组（struct-of-arrays）节点池
+    
+    节点是整数下标，值和后继（双向时还有前驱）分别存放在并行的类型化数组中，
+    每个节点只占几个机器字，没有对象头和指针对象。
+    释放的节点通过 next 字段串成空闲链表，分配时优先复用。
+    """
+    def __init__(self, typecode="q", doubly=False):
+        self.typecode = typecode
+        self.vals = array(typecode)
+        self.next = array("q")
+        self.prev = array("q") if doubly else None
+        self.free_head = NIL
+        self.live = 0
+    
+    def allocate(self, val):
+        """分配一个节点并返回其下标"""
+        index = self.free_head
+        if index != NIL:
+            self.free_head = self.next[index]
+            self.vals[index] = val
+            self.next[index] = NIL
+            if self.prev is not None:
+                self.prev[index] = NIL
+        else:
+            index = len(self.vals)
+            self.vals.append(val)
+            self.next.append(NIL)
+            if self.prev is not None:
+                self.prev.append(NIL)
+        self.live += 1
+        return index
+    
+    def release(self, index):
+        """释放节点，放回空闲链表"""
+        self.next[index] = self.free_head
+        self.free_head = index
+        self.live -= 1
+    
+    def __len__(self):
+        return self.live
+    
+    def memory_usage(self):
+        """统计数组占用的字节数（包括空闲节点的槽位）"""
+        fields = [self.vals, self.next] + ([self.prev] if self.prev is not None else [])
+        total_bytes = sum(sys.getsizeof(field) for field in fields)
+        return {
+            "nodes": self.live,
+            "slots": len(self.vals),
+            "bytes": total_bytes,
+            "bytes_per_node": total_bytes / self.live if self.live else 0.0,
+        }
+
+
+class PooledLinkedList:
+    """基于 NodePool 的单向链表，接口与 LinkedList 相同
+    
+    值必须能存入 typecode 对应的类型化数组；多个链表可以共享同一个节点池。
+    """
+    def __init__(self, typecode="q", pool=None):
+        self.pool = pool if pool is not None else NodePool(typecode)
+        self.head = NIL
+        self.tail = NIL
+        self.size = 0
+    
+    def append(self, val):
+        """在链表末尾添加节点"""
+        node = self.pool.allocate(val)
+        if self.head == NIL:
+            self.head = node
+        else:
+            self.pool.next[self.tail] = node
+        self.tail = node
+        self.size += 1
+    
+    def extend(self, values):
+        """把可迭代对象中的元素依次链接到链表末尾"""
+        for val in values:
+            self.append(val)
+    
+    def prepend(self, val):
+        """在链表头部添加节点"""
+        node = self.pool.allocate(val)
+        self.pool.next[node] = self.head
+        self.head = node
+        if self.tail == NIL:
+            self.tail = node
+        self.size += 1
+    
+    def _node_at(self, index):
+        nxt = self.pool.next
+        current = self.head
+        for _ in range(index):
+            current = nxt[current]
+        return current
+    
+    def insert(self, index, val):
+        """在指定位置插入节点"""
+        if index < 0 or index > self.size:
+            raise IndexError("Index out of range")
+        
+        if index == 0:
+            self.prepend(val)
+            return
+        if index == self.size:
+            self.append(val)
+            return
+        
+        current = self._node_at(index - 1)
+        node = self.pool.allocate(val)
+        self.pool.next[node] = self.pool.next[current]
+        self.pool.next[current] = node
+        self.size += 1
+    
+    def _unlink_after(self, prev):
+        """摘除 prev 的后继（prev 为 NIL 时摘除头节点）并释放"""
+        nxt = self.pool.next
+        node = self.head if prev == NIL else nxt[prev]
+        if prev == NIL:
+            self.head = nxt[node]
+        else:
+            nxt[prev] = nxt[node]
+        if node == self.tail:
+            self.tail = prev
+        self.pool.release(node)
+        self.size -= 1
+    
+    def delete(self, val):
+        """删除指定值的第一个节点"""
+        vals, nxt = self.pool.vals, self.pool.next
+        prev = NIL
+        current = self.head
+        while current != NIL:
+            if vals[current] == val:
+                self._unlink_after(prev)
+                return True
+            prev, current = current, nxt[current]
+        return False
+    
+    def delete_at(self, index):
+        """删除指定位置的节点"""
+        if index < 0 or index >= self.size:
+            raise IndexError("Index out of range")
+        self._unlink_after(NIL if index == 0 else self._node_at(index - 1))
+    
+    def find(self, val):
+        """查找值，返回索引"""
+        vals, nxt = self.pool.vals, self.pool.next
+        current = self.head
+        index = 0
+        while current != NIL:
+            if vals[current] == val:
+                return index
+            current = nxt[current]
+            index += 1
+        return -1
+    
+    def get(self, index):
+        """获取指定位置的值"""
+        if index < 0 or index >= self.size:
+            raise IndexError("Index out of range")
+        return self.pool.vals[self._node_at(index)]
+    
+    def reverse(self):
+        """反转链表"""
+        nxt = self.pool.next
+        prev = NIL
+        current = self.head
+        self.tail = current
+        while current != NIL:
+            nxt[current], prev, current = prev, current, nxt[current]
+        self.head = prev
+    
+    def display(self):
+        """显示链表内容"""
+        vals, nxt = self.pool.vals, self.pool.next
+        result = []
+        current = self.head
+        while current != NIL:
+            result.append(vals[current])
+            current = nxt[current]
+        return result
+    
+    def is_empty(self):
+        """检查链表是否为空"""
+        return self.head == NIL
+    
+    def length(self):
+        """获取链表长度"""
+        return self.size
+
+
+class PersistentNode:
+    """持久化链表节点，创建后不再修改，可被多个版本共享"""
+    __slots__ = ("val", "next")
+    
+    def __init__(self, val, next=None):
+        self.val = val
+        self.next = next
+
+
+class PersistentLinkedList:
+    """不可变的持久化单向链表
+    
+    每次“修改”都返回新版本，原版本保持不变。prepend/pop_front 与原版本
+    共享整个尾部，为O(1)；insert/delete 只复制修改位置之前的前缀。
+    版本可哈希，长度在创建时确定，哈希在第一次计算后缓存。
+    """
+    __slots__ = ("head", "size", "_hash")
+    
+    def __init__(self, values=(), *, head=None, size=0):
+        if values:
+            for val in reversed(list(values)):
+                head = PersistentNode(val, head)
+                size += 1
+        self.head = head
+        self.size = size
+        self._hash = None
+    
+    @classmethod
+    def _from_prefix(cls, prefix, rest, size):
+        """把 prefix 中的值依次复制到共享的尾部 rest 之前，生成新版本"""
+        head = rest
+        for val in reversed(prefix):
+            head = PersistentNode(val, head)
+        return cls(head=head, size=size)
+    
+    def prepend(self, val):
+        """返回头部加入 val 的新版本，O(1)"""
+        return PersistentLinkedList(head=PersistentNode(val, self.head), size=self.size + 1)
+    
+    def pop_front(self):
+        """返回去掉头部元素的新版本，O(1)"""
+        if self.head is None:
+            raise IndexError("List is empty")
+        return PersistentLinkedList(head=self.head.next, size=self.size - 1)
+    
+    def front(self):
+        """查看头部元素"""
+        if self.head is None:
+            raise IndexError("List is empty")
+        return self.head.val
+    
+    def _split(self, index):
+        """返回前 index 个值组成的列表和第 index 个节点"""
+        prefix = []
+        current = self.head
+        for _ in range(index):
+            prefix.append(current.val)
+            current = current.next
+        return prefix, current
+    
+    def insert(self, index, val):
+        """返回在指定位置插入 val 的新版本，复制 index 个节点"""
+        if index < 0 or index > self.size:
+            raise IndexError("Index out of range")
+        prefix, current = self._split(index)
+        prefix.append(val)
+        return self._from_prefix(prefix, current, self.size + 1)
+    
+    def append(self, val):
+        """返回末尾加入 val 的新版本，需要复制全部节点"""
+        return self.insert(self.size, val)
+    
+    def delete_at(self, index):
+        """返回删除指定位置元素的新版本，复制 index 个节点"""
+        if index < 0 or index >= self.size:
+            raise IndexError("Index out of range")
+        prefix, current = self._split(index)
+        return self._from_prefix(prefix, current.next, self.size - 1)
+    
+    def delete(self, val):
+        """返回删除第一个等于 val 的元素后的新版本；不存在时返回自身"""
+        index = self.find(val)
+        if index == -1:
+            return self
+        return self.delete_at(index)
+    
+    def reverse(self):
+        """返回反转后的新版本（所有节点都会改变，无法共享）"""
+        head = None
+        current = self.head
+        while current:
+            head = PersistentNode(current.val, head)
+            current = current.next
+        return PersistentLinkedList(head=head, size=self.size)
+    
+    def find(self, val):
+        """查找值，返回索引"""
+        for index, item in enumerate(self):
+            if item == val:
+                return index
+        return -1
+    
+    def get(self, index):
+        """获取指定位置的值"""
+        if index < 0 or index >= self.size:
+            raise IndexError("Index out of range")
+        return self._split(index)[1].val
+    
+    def __iter__(self):
+        current = self.head
+        while current:
+            yield current.val
+            current = current.next
+    
+    def __len__(self):
+        return self.size
+    
+    def __contains__(self, val):
+        return self.find(val) != -1
+    
+    def __eq__(self, other):
+        if not isinstance(other, PersistentLinkedList):
+            return NotImplemented
+        if self.size != other.size:
+            return False
+        a, b = self.head, other.head
+        while a is not b:  # 遇到共享的尾部即可提前结束
+            if a.val != b.val:
+                return False
+            a, b = a.next, b.next
+        return True
+    
+    def __hash__(self):
+        if self._hash is None:
+            h = hash(self.size)
+            for val in self:
+                h = hash((h, val))
+            self._hash = h
+        return self._hash
+    
+    def display(self):
+        """显示链表内容"""
+        return list(self)
+    
+    def is_empty(self):
+        """检查链表是否为空"""
+        return self.head is None
+    
     def length(self):
         """获取链表长度"""
         return self.size
@@ -254,6 +1607,22 @@ def demo():
     
     print(f"\n7. 链表长度: {ll.length()}")
     
+    print("\n8. 批量追加:")
+    ll.extend([4, 5, 6])
+    print(f"   追加[4, 5, 6]后: {ll.display()}")
+    
+    print("\n9. 惰性迭代:")
+    print(f"   反向迭代: {list(reversed(ll))}")
+    print(f"   切片[1:4]: {list(ll.islice(1, 4))}, 包含5: {5 in ll}")
+    
+    print("\n10. 原地归并排序:")
+    ll.sort()
+    print(f"   排序后: {ll.display()}")
+    other = LinkedList()
+    other.extend([1.5, 4.5, 9])
+    ll.merge_sorted(other)
+    print(f"   合并有序链表[1.5, 4.5, 9]后: {ll.display()}")
+    
     print("\n=== 双向链表演示 ===")
     
     dll = DoublyLinkedList()
@@ -268,6 +1637,87 @@ def demo():
     dll.delete(20)
     print(f"删除20后正向遍历: {dll.display_forward()}")
     print(f"链表长度: {dll.length()}")
+    
+    node = dll.append(40)
+    dll.insert_after(node, 50)
+    dll.move_to_front(node)
+    print(f"追加40、其后插入50、再把40移到头部: {dll.display_forward()}")
+    
+    other = DoublyLinkedList()
+    other.append(60)
+    other.append(70)
+    dll.concat(other)
+    rest = dll.split_at(node.next)
+    print(f"拼接[60, 70]后从5处拆开: {dll.display_forward()} 和 {rest.display_forward()}")
+    rest.rotate(2)
+    print(f"后半部分右旋2步: {rest.display_forward()}")
+    
+    print("\n=== 并发双向链表演示 ===")
+    
+    cdll = ConcurrentDoublyLinkedList()
+    workers = [threading.Thread(target=lambda t=t: [cdll.append(t * 100 + i) for i in range(50)])
+               for t in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    print(f"4个线程各追加50个元素后长度: {cdll.length()}")
+    print(f"头部弹出: {cdll.pop_front() % 100}, 尾部弹出: {cdll.pop_back() % 100}")
+    
+    print("\n=== LRU缓存演示 ===")
+    
+    evicted = []
+    cache = LRUCache(3, on_evict=lambda k, v: evicted.append(k))
+    for key in "abc":
+        cache.put(key, key.upper())
+    cache.get("a")
+    cache.put("d", "D")
+    cache.get("b")
+    print(f"最近使用顺序: {cache.keys()}, 被淘汰: {evicted}")
+    stats = cache.stats()
+    print(f"命中 {stats['hits']} 次, 未命中 {stats['misses']} 次")
+    
+    print("\n=== 可索引跳表演示 ===")
+    
+    skip = SkipLinkedList(seed=42)
+    skip.extend(range(10))
+    skip.insert(5, 4.5)
+    skip.delete_at(0)
+    print(f"插入4.5并删除位置0后: {skip.display()}")
+    print(f"位置5的元素: {skip.get(5)}")
+    usage = skip.memory_usage()
+    print(f"平均层数: {usage['avg_level']:.2f}, 每元素约 {usage['bytes_per_element']:.0f} 字节")
+    
+    print("\n=== 展开链表演示 ===")
+    
+    unrolled = UnrolledLinkedList(block_size=4)
+    unrolled.extend(range(10))
+    unrolled.insert(3, 2.5)
+    unrolled.delete(7)
+    print(f"正向遍历: {unrolled.display_forward()}")
+    print(f"反向遍历: {unrolled.display_backward()}")
+    print(f"位置3的元素: {unrolled.get(3)}, 节点数: {unrolled.memory_usage()['nodes']}")
+    
+    print("\n=== 节点池链表演示 ===")
+    
+    pooled = PooledLinkedList(typecode="q")
+    pooled.extend([1, 2, 3, 4])
+    pooled.delete(2)
+    pooled.append(5)  # 复用被删除节点的槽位
+    pooled.reverse()
+    print(f"反转后: {pooled.display()}")
+    usage = pooled.pool.memory_usage()
+    print(f"节点数: {usage['nodes']}, 槽位数: {usage['slots']}")
+    
+    print("\n=== 持久化链表演示 ===")
+    
+    v1 = PersistentLinkedList([2, 3, 4])
+    v2 = v1.prepend(1)
+    v3 = v2.delete(3)
+    print(f"v1: {v1.display()}, v2: {v2.display()}, v3: {v3.display()}")
+    print(f"v2与v1共享尾部: {v2.head.next is v1.head}")
+    print(f"v3与v1共享节点4: {v3.head.next.next is v1.head.next.next}")
+    print(f"v3 == [1, 2, 4]: {v3 == PersistentLinkedList([1, 2, 4])}, 可作为字典键: {len({v1: 1, v3: 3})}")
 
 
 if __name__ == "__main__":
@@ -3,6 +3,10 @@
 包含基于数组和链表的队列实现，以及循环队列和双端队列
 """
 
+import itertools
+
+from linked_list import iter_reversed
+
 class ArrayQueue:
     """基于数组的队列实现"""
     def __init__(self, capacity=None):
@@ -48,20 +52,27 @@ class ArrayQueue:
 
 class QueueNode:
     """队列节点"""
+    __slots__ = ("data", "next")
+    
     def __init__(self, data):
         self.data = data
         self.next = None
 
 
 class LinkedQueue:
-    """基于链表的队列实现"""
+    """基于链表的队列实现
+    
+    迭代顺序为从队头到队尾，迭代期间入队或出队会抛出 RuntimeError。
+    """
     def __init__(self):
         self.front_node = None
         self.rear_node = None
         self._size = 0
+        self._mods = 0
     
     def enqueue(self, item):
         """入队"""
+        self._mods += 1
         new_node = QueueNode(item)
         if self.rear_node is None:
             self.front_node = self.rear_node = new_node
@@ -75,6 +86,7 @@ class LinkedQueue:
         if self.is_empty():
             raise IndexError("Queue is empty")
         
+        self._mods += 1
         data = self.front_node.data
         self.front_node = self.front_node.next
         
@@ -104,14 +116,33 @@ class LinkedQueue:
         """获取队列大小"""
         return self._size
     
-    def display(self):
-        """显示队列内容"""
-        result = []
+    def __iter__(self):
+        """从队头到队尾惰性迭代"""
+        mods = self._mods
         current = self.front_node
         while current:
-            result.append(current.data)
+            yield current.data
+            if self._mods != mods:
+                raise RuntimeError("LinkedQueue modified during iteration")
             current = current.next
-        return result
+    
+    def __reversed__(self):
+        """从队尾到队头迭代，额外内存O(√n)"""
+        return iter_reversed(self, self.front_node, self._size, "data")
+    
+    def __len__(self):
+        return self._size
+    
+    def __contains__(self, item):
+        return any(data == item for data in self)
+    
+    def islice(self, start, stop=None):
+        """惰性切片：只遍历到 stop 为止"""
+        return itertools.islice(self, start, stop)
+    
+    def display(self):
+        """显示队列内容"""
+        return list(self)
 
 
 class CircularQueue:
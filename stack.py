@@ -3,6 +3,17 @@
 包含基于数组和链表的栈实现
 """
 
+import functools
+import itertools
+import operator
+import os
+import re
+from array import array
+
+from linked_list import iter_reversed
+from workers import map_workers
+
+
 class ArrayStack:
     """基于数组的栈实现"""
     def __init__(self, capacity=None):
@@ -40,21 +51,171 @@ class ArrayStack:
         return self.items.copy()
 
 
+class SegmentedArrayStack:
+    """分段数组栈
+    
+    元素存放在若干预分配的定长段中，栈顶所在段写满时再接一段；
+    弹空的段放入备用列表留待复用，而不是释放后再重新分配。
+    容量只在换段时检查，push_many/pop_many/peek_many 每段只做一次切片操作。
+    """
+    def __init__(self, capacity=None, segment_size=4096, spare_segments=4):
+        if segment_size < 1:
+            raise ValueError("segment_size must be positive")
+        self.capacity = capacity
+        self.segment_size = segment_size
+        self.spare_segments = spare_segments
+        self._segments = []
+        self._spare = []
+        self._seg = None
+        self._pos = 0    # 栈顶段中下一个空位
+        self._end = 0    # 栈顶段中可写到的位置（受 capacity 限制）
+        self._base = 0   # 栈顶段之下各段的元素总数
+    
+    def _grow(self):
+        """栈顶段已满，接上一个新段"""
+        if self.capacity is not None and self._base + self._pos >= self.capacity:
+            raise OverflowError("Stack overflow")
+        if self._seg is not None:
+            self._base += self._pos
+        seg = self._spare.pop() if self._spare else [None] * self.segment_size
+        self._segments.append(seg)
+        self._seg = seg
+        self._pos = 0
+        self._end = self.segment_size
+        if self.capacity is not None:
+            self._end = min(self.segment_size, self.capacity - self._base)
+    
+    def _shrink(self):
+        """栈顶段已空，退回到下一段的末尾，空段留作备用"""
+        if self._base == 0:
+            raise IndexError("Stack is empty")
+        seg = self._segments.pop()
+        if len(self._spare) < self.spare_segments:
+            self._spare.append(seg)
+        self._seg = self._segments[-1]
+        self._base -= self.segment_size
+        self._pos = self._end = self.segment_size
+    
+    def push(self, item):
+        """入栈"""
+        if self._pos == self._end:
+            self._grow()
+        self._seg[self._pos] = item
+        self._pos += 1
+    
+    def pop(self):
+        """出栈"""
+        if self._pos == 0:
+            self._shrink()
+        self._pos -= 1
+        item = self._seg[self._pos]
+        self._seg[self._pos] = None
+        return item
+    
+    def peek(self):
+        """查看栈顶元素"""
+        if self._pos == 0:
+            if self._base == 0:
+                raise IndexError("Stack is empty")
+            return self._segments[-2][-1]
+        return self._seg[self._pos - 1]
+    
+    def push_many(self, items):
+        """按顺序批量入栈（最后一个元素位于栈顶），超出容量时不入栈任何元素"""
+        items = items if isinstance(items, list) else list(items)
+        if self.capacity is not None and self.size() + len(items) > self.capacity:
+            raise OverflowError("Stack overflow")
+        i, n = 0, len(items)
+        while i < n:
+            if self._pos == self._end:
+                self._grow()
+            take = min(self._end - self._pos, n - i)
+            self._seg[self._pos:self._pos + take] = items[i:i + take]
+            self._pos += take
+            i += take
+    
+    def pop_many(self, k):
+        """弹出 k 个元素，按出栈顺序（栈顶在前）返回"""
+        if k < 0:
+            raise ValueError("k must be non-negative")
+        if k > self.size():
+            raise IndexError("Stack underflow")
+        result = []
+        while k:
+            if self._pos == 0:
+                self._shrink()
+            take = min(self._pos, k)
+            start = self._pos - take
+            chunk = self._seg[start:self._pos]
+            self._seg[start:self._pos] = [None] * take
+            chunk.reverse()
+            result += chunk
+            self._pos = start
+            k -= take
+        return result
+    
+    def peek_many(self, k):
+        """查看栈顶的 k 个元素（栈顶在前），不出栈"""
+        if k < 0:
+            raise ValueError("k must be non-negative")
+        if k > self.size():
+            raise IndexError("Stack underflow")
+        result = []
+        index = len(self._segments) - 1
+        stop = self._pos
+        while k:
+            take = min(stop, k)
+            chunk = self._segments[index][stop - take:stop]
+            chunk.reverse()
+            result += chunk
+            k -= take
+            index -= 1
+            stop = self.segment_size
+        return result
+    
+    def is_empty(self):
+        """检查栈是否为空"""
+        return self.size() == 0
+    
+    def size(self):
+        """获取栈的大小"""
+        return self._base + self._pos
+    
+    def __len__(self):
+        return self._base + self._pos
+    
+    def display(self):
+        """显示栈内容（从栈底到栈顶）"""
+        result = []
+        for seg in self._segments[:-1]:
+            result += seg
+        if self._seg is not None:
+            result += self._seg[:self._pos]
+        return result
+
+
 class StackNode:
     """栈节点"""
+    __slots__ = ("data", "next")
+    
     def __init__(self, data):
         self.data = data
         self.next = None
 
 
 class LinkedStack:
-    """基于链表的栈实现"""
+    """基于链表的栈实现
+    
+    迭代顺序为从栈顶到栈底，迭代期间入栈或出栈会抛出 RuntimeError。
+    """
     def __init__(self):
         self.head = None
         self._size = 0
+        self._mods = 0
     
     def push(self, item):
         """入栈"""
+        self._mods += 1
         new_node = StackNode(item)
         new_node.next = self.head
         self.head = new_node
@@ -65,6 +226,7 @@ class LinkedStack:
         if self.is_empty():
             raise IndexError("Stack is empty")
         
+        self._mods += 1
         data = self.head.data
         self.head = self.head.next
         self._size -= 1
@@ -84,14 +246,367 @@ class LinkedStack:
         """获取栈的大小"""
         return self._size
     
-    def display(self):
-        """显示栈内容（从栈顶到栈底）"""
-        result = []
+    def __iter__(self):
+        """从栈顶到栈底惰性迭代"""
+        mods = self._mods
         current = self.head
         while current:
-            result.append(current.data)
+            yield current.data
+            if self._mods != mods:
+                raise RuntimeError("LinkedStack modified during iteration")
             current = current.next
-        return result
+    
+    def __reversed__(self):
+        """从栈底到栈顶迭代，额外内存O(√n)"""
+        return iter_reversed(self, self.head, self._size, "data")
+    
+    def __len__(self):
+        return self._size
+    
+    def __contains__(self, item):
+        return any(data == item for data in self)
+    
+    def islice(self, start, stop=None):
+        """惰性切片：只遍历到 stop 为止"""
+        return itertools.islice(self, start, stop)
+    
+    def display(self):
+        """显示栈内容（从栈顶到栈底）"""
+        return list(self)
+
+
+def _lift_min_max_sum(value):
+    return (value, value, value)
+
+
+def _combine_min_max_sum(a, b):
+    return (a[0] if a[0] <= b[0] else b[0], a[1] if a[1] >= b[1] else b[1], a[2] + b[2])
+
+
+class _AggregateMixin:
+    """聚合栈的公共部分：每个元素旁边保存从栈底到它为止的聚合值
+    
+    聚合值 = combine(下面一层的聚合值, lift(元素))，combine 必须满足结合律。
+    combine 和 lift 都不指定时聚合 (min, max, sum)，此时 min()/max()/sum() 可用；
+    指定 combine 时默认 lift 为恒等映射；只指定 lift 时 lift 须返回
+    (min, max, sum) 形式的三元组。后两种情况都通过 aggregate() 读取结果。
+    """
+    def _init_aggregate(self, combine, lift):
+        self._default_aggregate = combine is None and lift is None
+        self.combine = combine or _combine_min_max_sum
+        self.lift = lift or (_lift_min_max_sum if combine is None else (lambda value: value))
+    
+    def _next_aggregate(self, below, item):
+        value = self.lift(item)
+        return value if below is None else self.combine(below, value)
+    
+    def _check_default(self, name):
+        if not self._default_aggregate:
+            raise TypeError(f"{name}() requires the default min/max/sum aggregate")
+    
+    def min(self):
+        """当前栈内的最小值，O(1)"""
+        self._check_default("min")
+        return self.aggregate()[0]
+    
+    def max(self):
+        """当前栈内的最大值，O(1)"""
+        self._check_default("max")
+        return self.aggregate()[1]
+    
+    def sum(self):
+        """当前栈内元素之和，O(1)；空栈为0"""
+        self._check_default("sum")
+        return self.aggregate()[2] if not self.is_empty() else 0
+
+
+class AggregateArrayStack(_AggregateMixin, ArrayStack):
+    """维护聚合值的数组栈：每次 push/pop 后 min()/max()/sum() 均为O(1)"""
+    def __init__(self, capacity=None, combine=None, lift=None):
+        super().__init__(capacity)
+        self.aggregates = []
+        self._init_aggregate(combine, lift)
+    
+    def push(self, item):
+        """入栈，同时记录新的聚合值"""
+        below = self.aggregates[-1] if self.aggregates else None
+        aggregate = self._next_aggregate(below, item)
+        super().push(item)
+        self.aggregates.append(aggregate)
+    
+    def pop(self):
+        """出栈，下一层的聚合值自动成为当前值"""
+        item = super().pop()
+        self.aggregates.pop()
+        return item
+    
+    def aggregate(self):
+        """栈内全部元素（从栈底到栈顶）的聚合值"""
+        if not self.aggregates:
+            raise IndexError("Stack is empty")
+        return self.aggregates[-1]
+
+
+class AggregateStackNode(StackNode):
+    """带聚合值的栈节点"""
+    __slots__ = ("aggregate",)
+    
+    def __init__(self, data, aggregate):
+        super().__init__(data)
+        self.aggregate = aggregate
+
+
+class AggregateLinkedStack(_AggregateMixin, LinkedStack):
+    """维护聚合值的链表栈：聚合值保存在每个节点中"""
+    def __init__(self, combine=None, lift=None):
+        super().__init__()
+        self._init_aggregate(combine, lift)
+    
+    def push(self, item):
+        """入栈，同时记录新的聚合值"""
+        self._mods += 1
+        below = self.head.aggregate if self.head else None
+        new_node = AggregateStackNode(item, self._next_aggregate(below, item))
+        new_node.next = self.head
+        self.head = new_node
+        self._size += 1
+    
+    def aggregate(self):
+        """栈内全部元素（从栈底到栈顶）的聚合值"""
+        if self.head is None:
+            raise IndexError("Stack is empty")
+        return self.head.aggregate
+
+
+class SlidingWindowAggregator:
+    """用两个聚合栈实现的队列，支持摊还O(1)的滑动窗口聚合
+    
+    新元素压入 back 栈；出队时若 front 栈为空，把 back 栈全部倒入 front 栈，
+    此时 front 栈顶是最旧的元素。front 栈按相反方向折叠，
+    整个窗口的聚合值 = combine(front 的聚合值, back 的聚合值)。
+    每个元素最多被倒一次，因此 push/popleft/aggregate 都是摊还O(1)。
+    combine 和 lift 都为 None 时聚合 (min, max, sum)，可直接调用 min()/max()/sum()。
+    """
+    def __init__(self, combine=None, window=None, lift=None):
+        if window is not None and window < 1:
+            raise ValueError("window must be positive")
+        self.window = window
+        self.back = AggregateArrayStack(combine=combine, lift=lift)
+        flipped = None if combine is None else (lambda below, value: combine(value, below))
+        self.front = AggregateArrayStack(combine=flipped, lift=lift)
+    
+    def push(self, item):
+        """加入新元素，窗口已满时先移出最旧的元素"""
+        if self.window is not None and len(self) >= self.window:
+            self.popleft()
+        self.back.push(item)
+    
+    def popleft(self):
+        """移出并返回最旧的元素"""
+        if self.front.is_empty():
+            if self.back.is_empty():
+                raise IndexError("Window is empty")
+            while not self.back.is_empty():
+                self.front.push(self.back.pop())
+        return self.front.pop()
+    
+    def aggregate(self):
+        """窗口内全部元素（从旧到新）的聚合值"""
+        if self.front.is_empty():
+            return self.back.aggregate()
+        if self.back.is_empty():
+            return self.front.aggregate()
+        return self.back.combine(self.front.aggregate(), self.back.aggregate())
+    
+    def min(self):
+        """窗口内的最小值"""
+        self.back._check_default("min")
+        return self.aggregate()[0]
+    
+    def max(self):
+        """窗口内的最大值"""
+        self.back._check_default("max")
+        return self.aggregate()[1]
+    
+    def sum(self):
+        """窗口内元素之和，空窗口为0"""
+        self.back._check_default("sum")
+        return self.aggregate()[2] if len(self) else 0
+    
+    def is_empty(self):
+        """检查窗口是否为空"""
+        return len(self) == 0
+    
+    def __len__(self):
+        return self.front.size() + self.back.size()
+
+
+_TOKEN_RE = re.compile(r"\s*(?:((?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)|([A-Za-z_]\w*)|(\S))")
+
+# 运算符: (优先级, 是否右结合, 操作数个数, 函数)；"u-" 表示一元负号
+_OPERATORS = {
+    "+": (1, False, 2, operator.add),
+    "-": (1, False, 2, operator.sub),
+    "*": (2, False, 2, operator.mul),
+    "/": (2, False, 2, operator.truediv),
+    "u-": (3, True, 1, operator.neg),
+    "^": (4, True, 2, operator.pow),
+}
+
+
+class CompiledExpression:
+    """编译后的表达式：保存后缀程序，并预先把它组装成嵌套函数
+    
+    求值时不再解析字符串，只调用组装好的函数；
+    同一表达式由 StackApplications.compile_expression 缓存复用
+    """
+    def __init__(self, expression, postfix):
+        self.expression = expression
+        self.postfix = postfix
+        self.variables = tuple(sorted({t for t in postfix
+                                       if isinstance(t, str) and t not in _OPERATORS}))
+        self._func = self._build(postfix)
+    
+    @staticmethod
+    def _build(postfix):
+        """用栈把后缀程序组装成 env -> 值 的函数"""
+        stack = ArrayStack()
+        for token in postfix:
+            if isinstance(token, str) and token in _OPERATORS:
+                _, _, arity, func = _OPERATORS[token]
+                if stack.size() < arity:
+                    raise ValueError("Invalid expression")
+                if arity == 1:
+                    operand = stack.pop()
+                    stack.push(lambda env, f=func, a=operand: f(a(env)))
+                else:
+                    right = stack.pop()
+                    left = stack.pop()
+                    stack.push(lambda env, f=func, a=left, b=right: f(a(env), b(env)))
+            elif isinstance(token, str):
+                stack.push(operator.itemgetter(token))
+            else:
+                stack.push(lambda env, c=token: c)
+        if stack.size() != 1:
+            raise ValueError("Invalid expression")
+        return stack.pop()
+    
+    def evaluate(self, bindings=None, **values):
+        """代入变量求值，变量可以用字典或关键字参数给出"""
+        env = dict(bindings or {}, **values)
+        try:
+            return self._func(env)
+        except ZeroDivisionError:
+            raise ValueError("Division by zero") from None
+    
+    __call__ = evaluate
+
+
+_BRACKET_RE = re.compile(r"[()\[\]{}]")
+_BRACKET_BYTES_RE = re.compile(rb"[()\[\]{}]")
+# 括号 -> (种类, 是否为左括号)
+_BRACKETS = {"(": (0, True), ")": (0, False), "[": (1, True), "]": (1, False),
+             "{": (2, True), "}": (2, False)}
+_BRACKETS.update({k.encode(): v for k, v in _BRACKETS.items()})
+
+
+class BracketSummary:
+    """一段输入的括号归约结果，可按顺序结合（满足结合律）
+    
+    closers/closer_offsets: 段内找不到左括号、需要与前面的输入匹配的右括号
+    openers/opener_offsets: 段末仍未闭合的左括号（栈底在前）
+    error: 段内第一个与左括号种类不匹配的右括号的偏移，没有时为 -1；
+    出错之后的内容不再影响结果
+    """
+    def __init__(self):
+        self.closers = bytearray()
+        self.closer_offsets = array("q")
+        self.openers = bytearray()
+        self.opener_offsets = array("q")
+        self.error = -1
+    
+    @classmethod
+    def reduce(cls, chunk, base=0):
+        """用栈归约一段输入（str 或 bytes），偏移从 base 开始计"""
+        summary = cls()
+        openers, opener_offsets = summary.openers, summary.opener_offsets
+        pattern = _BRACKET_BYTES_RE if isinstance(chunk, (bytes, bytearray)) else _BRACKET_RE
+        for match in pattern.finditer(chunk):
+            kind, is_open = _BRACKETS[match.group()]
+            offset = base + match.start()
+            if is_open:
+                openers.append(kind)
+                opener_offsets.append(offset)
+            elif not openers:
+                summary.closers.append(kind)
+                summary.closer_offsets.append(offset)
+            elif openers[-1] != kind:
+                summary.error = offset
+                break
+            else:
+                openers.pop()
+                opener_offsets.pop()
+        return summary
+    
+    def combine(self, other):
+        """把紧随其后的一段的归约结果 other 合并进来（原地修改并返回自身）"""
+        if self.error != -1:
+            return self
+        for kind, offset in zip(other.closers, other.closer_offsets):
+            if not self.openers:
+                self.closers.append(kind)
+                self.closer_offsets.append(offset)
+            elif self.openers[-1] != kind:
+                self.error = offset
+                return self
+            else:
+                self.openers.pop()
+                self.opener_offsets.pop()
+        self.openers += other.openers
+        self.opener_offsets += other.opener_offsets
+        self.error = other.error
+        return self
+    
+    def first_mismatch(self):
+        """把这段当作完整输入时第一个不匹配处的偏移，完全匹配时返回 -1
+        
+        多余的右括号或种类不匹配的右括号报告其自身位置；
+        输入结束时仍未闭合的左括号报告最外层那个的位置
+        """
+        if self.closers:
+            return self.closer_offsets[0]
+        if self.error != -1:
+            return self.error
+        if self.openers:
+            return self.opener_offsets[0]
+        return -1
+
+
+def _iter_chunks(source, chunk_size):
+    """把文件路径、文件对象或分块迭代器统一为分块迭代器"""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            yield from iter(lambda: f.read(chunk_size), b"")
+    elif hasattr(source, "read"):
+        yield from iter(lambda: source.read(chunk_size), source.read(0))
+    else:
+        yield from source
+
+
+def _reduce_file_range(conn, path, start, stop, chunk_size):
+    """子进程：归约文件中 [start, stop) 字节，结果经管道送回"""
+    summary = BracketSummary()
+    with open(path, "rb") as f:
+        f.seek(start)
+        offset = start
+        while offset < stop and summary.error == -1:
+            chunk = f.read(min(chunk_size, stop - offset))
+            if not chunk:
+                break
+            summary.combine(BracketSummary.reduce(chunk, offset))
+            offset += len(chunk)
+    conn.send(summary)
+    conn.close()
 
 
 class StackApplications:
@@ -115,6 +630,40 @@ class StackApplications:
         
         return stack.is_empty()
     
+    @staticmethod
+    def find_bracket_mismatch(source, chunk_size=1 << 20):
+        """流式检查括号，返回第一个不匹配处的偏移，全部匹配时返回 -1
+        
+        source 可以是文件路径（按字节读取，偏移为字节偏移）、文件对象，
+        或产生 str/bytes 分块的可迭代对象。每次只持有一个分块和
+        尚未闭合的左括号（每个1字节种类 + 8字节偏移），发现错误后立即停止读取。
+        """
+        summary = BracketSummary()
+        offset = 0
+        for chunk in _iter_chunks(source, chunk_size):
+            summary.combine(BracketSummary.reduce(chunk, offset))
+            offset += len(chunk)
+            if summary.closers or summary.error != -1:
+                break
+        return summary.first_mismatch()
+    
+    @staticmethod
+    def find_bracket_mismatch_parallel(path, workers=None, chunk_size=1 << 20):
+        """多进程检查文件中的括号，结果与 find_bracket_mismatch 相同
+        
+        文件按字节切分为 workers 段，各子进程独立归约为 BracketSummary，
+        主进程按顺序结合。
+        """
+        size = os.path.getsize(path)
+        workers = max(1, min(workers or os.cpu_count() or 1, size // chunk_size))
+        if workers == 1:
+            return StackApplications.find_bracket_mismatch(path, chunk_size)
+        
+        bounds = [size * i // workers for i in range(workers + 1)]
+        summaries = map_workers(_reduce_file_range, [
+            (path, bounds[i], bounds[i + 1], chunk_size) for i in range(workers)])
+        return functools.reduce(BracketSummary.combine, summaries).first_mismatch()
+    
     @staticmethod
     def infix_to_postfix(expression):
         """中缀表达式转后缀表达式"""
@@ -176,6 +725,115 @@ class StackApplications:
         
         return stack.pop()
     
+    @staticmethod
+    def tokenize(expression):
+        """把中缀表达式切分为记号
+        
+        数字转换为 int/float，变量名保持为字符串，支持多位数、小数、科学计数法；
+        出现在表达式开头、运算符或左括号之后的 "-" 记为一元负号 "u-"，
+        一元 "+" 直接忽略
+        """
+        tokens = []
+        pos = 0
+        expression = expression.rstrip()
+        while pos < len(expression):
+            match = _TOKEN_RE.match(expression, pos)
+            number, name, symbol = match.groups()
+            pos = match.end()
+            if number is not None:
+                is_float = any(c in number for c in ".eE")
+                tokens.append(float(number) if is_float else int(number))
+            elif name is not None:
+                tokens.append(name)
+            elif symbol in "+-" and (not tokens or tokens[-1] == "(" or
+                                     (isinstance(tokens[-1], str) and tokens[-1] in _OPERATORS)):
+                if symbol == "-":
+                    tokens.append("u-")
+            elif symbol in _OPERATORS or symbol in "()":
+                tokens.append(symbol)
+            else:
+                raise ValueError(f"Unexpected character {symbol!r} at position {pos - 1}")
+        return tokens
+    
+    @staticmethod
+    def tokens_to_postfix(tokens):
+        """调度场算法：把记号序列转换为后缀程序（记号列表）"""
+        stack = ArrayStack()
+        postfix = []
+        for token in tokens:
+            if token == "(":
+                stack.push(token)
+            elif token == ")":
+                while not stack.is_empty() and stack.peek() != "(":
+                    postfix.append(stack.pop())
+                if stack.is_empty():
+                    raise ValueError("Mismatched parentheses")
+                stack.pop()
+            elif isinstance(token, str) and token in _OPERATORS:
+                precedence, right_assoc, arity, _ = _OPERATORS[token]
+                # 前缀一元运算符还没有操作数，不能弹出栈中的运算符
+                while arity == 2 and not stack.is_empty() and stack.peek() != "(":
+                    top = _OPERATORS[stack.peek()][0]
+                    if top > precedence or (top == precedence and not right_assoc):
+                        postfix.append(stack.pop())
+                    else:
+                        break
+                stack.push(token)
+            else:
+                postfix.append(token)
+        while not stack.is_empty():
+            token = stack.pop()
+            if token == "(":
+                raise ValueError("Mismatched parentheses")
+            postfix.append(token)
+        return postfix
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def compile_expression(expression):
+        """解析并编译表达式，结果按表达式字符串缓存"""
+        tokens = StackApplications.tokenize(expression)
+        return CompiledExpression(expression, StackApplications.tokens_to_postfix(tokens))
+    
+    @staticmethod
+    def evaluate_batch(program, columns):
+        """对整列输入一次性求值
+        
+        program 为表达式字符串或 CompiledExpression，columns 把变量名映射到等长序列。
+        按后缀程序逐个运算符处理：栈中的每一项是整列结果（或常量），
+        每个运算符用一次 map 作用于整列，而不是逐行调用求值函数。
+        """
+        if isinstance(program, str):
+            program = StackApplications.compile_expression(program)
+        lengths = {len(columns[name]) for name in program.variables or columns}
+        if len(lengths) > 1:
+            raise ValueError("Columns must have the same length")
+        rows = lengths.pop() if lengths else 1
+        
+        stack = ArrayStack()  # 每项为 (是否为整列, 值)
+        try:
+            for token in program.postfix:
+                if isinstance(token, str) and token in _OPERATORS:
+                    func, arity = _OPERATORS[token][3], _OPERATORS[token][2]
+                    operands = [stack.pop() for _ in range(arity)][::-1]
+                    if not any(is_column for is_column, _ in operands):
+                        stack.push((False, func(*(value for _, value in operands))))
+                        continue
+                    args = [value if is_column else itertools.repeat(value)
+                            for is_column, value in operands]
+                    stack.push((True, list(map(func, *args))))
+                elif isinstance(token, str):
+                    stack.push((True, columns[token]))
+                else:
+                    stack.push((False, token))
+        except ZeroDivisionError:
+            raise ValueError("Division by zero") from None
+        
+        is_column, result = stack.pop()
+        if not is_column:
+            return [result] * rows
+        return list(result)
+    
     @staticmethod
     def decimal_to_binary(number):
         """十进制转二进制"""
@@ -214,6 +872,34 @@ def demo():
         popped = stack1.pop()
         print(f"   出栈 {popped}: {stack1.display()}")
     
+    print("\n=== 分段数组栈演示 ===")
+    
+    sstack = SegmentedArrayStack(segment_size=4)
+    sstack.push_many(range(10))
+    print(f"批量入栈0..9: {sstack.display()}")
+    print(f"栈顶3个: {sstack.peek_many(3)}")
+    print(f"批量出栈6个: {sstack.pop_many(6)}, 剩余: {sstack.display()}")
+    for k in (-1, 5):
+        try:
+            sstack.pop_many(k)
+        except (ValueError, IndexError) as e:
+            print(f"批量出栈{k}个: {type(e).__name__}({e}), 剩余: {sstack.display()}")
+    
+    print("\n=== 聚合栈与滑动窗口演示 ===")
+    
+    astack = AggregateLinkedStack()
+    for value in [5, 2, 8, 1]:
+        astack.push(value)
+    print(f"入栈[5, 2, 8, 1]: min={astack.min()}, max={astack.max()}, sum={astack.sum()}")
+    astack.pop()
+    print(f"出栈1后: min={astack.min()}, max={astack.max()}, sum={astack.sum()}")
+    
+    latencies = SlidingWindowAggregator(window=3)
+    for latency in [120, 80, 95, 300, 60]:
+        latencies.push(latency)
+        print(f"   延迟 {latency}: 最近3次 min={latencies.min()}, max={latencies.max()}, "
+              f"sum={latencies.sum()}")
+    
     print("\n=== 基于链表的栈演示 ===")
     
     stack2 = LinkedStack()
@@ -238,6 +924,11 @@ def demo():
         result = StackApplications.is_balanced_parentheses(expr)
         print(f"   '{expr}' 平衡: {result}")
     
+    print("\n   流式检查，报告第一个不匹配处的偏移:")
+    for chunks in (["{\"a\": [1, 2", "], \"b\": (3)}"], ["{[(", "])}"], ["((", ")"]):
+        offset = StackApplications.find_bracket_mismatch(chunks)
+        print(f"   {chunks} -> {offset}")
+    
     print("\n2. 中缀转后缀:")
     infix = "a+b*c"
     postfix = StackApplications.infix_to_postfix(infix)
@@ -248,7 +939,14 @@ def demo():
     result = StackApplications.evaluate_postfix(postfix_expr)
     print(f"   {postfix_expr} = {result}")
     
-    print("\n4. 十进制转二进制:")
+    print("\n4. 编译表达式并按列批量求值:")
+    program = StackApplications.compile_expression("-x^2 + 2.5*(y - 10) / 4")
+    print(f"   后缀程序: {program.postfix}")
+    print(f"   x=3, y=14 时: {program(x=3, y=14)}")
+    columns = {"x": [1, 2, 3], "y": [10, 14, 18]}
+    print(f"   按列求值 {columns}: {StackApplications.evaluate_batch(program, columns)}")
+    
+    print("\n5. 十进制转二进制:")
     numbers = [10, 25, 42]
     for num in numbers:
         binary = StackApplications.decimal_to_binary(num)
@@ -0,0 +1,46 @@
+"""
+多进程辅助函数
+array_operations 的并行排序和 stack 的并行括号检查共用的子进程启动与结果收集
+"""
+
+import multiprocessing
+
+
+def start_workers(target, args_list):
+    """为每组参数启动一个子进程，由 join_workers 等待结束
+    
+    本仓库的 queue.py 会遮蔽标准库 queue 模块，而 ProcessPoolExecutor
+    和 multiprocessing.Pool 都依赖它，因此这里直接管理 Process。
+    """
+    procs = [multiprocessing.Process(target=target, args=args) for args in args_list]
+    for proc in procs:
+        proc.start()
+    return procs
+
+
+def join_workers(procs):
+    """等待子进程全部结束，任何一个异常退出时抛出 RuntimeError"""
+    for proc in procs:
+        proc.join()
+    if any(proc.exitcode != 0 for proc in procs):
+        raise RuntimeError("worker process failed")
+
+
+def map_workers(target, args_list):
+    """为每组参数启动一个子进程，按 args_list 的顺序返回各子进程的结果
+    
+    target 的第一个参数是管道的发送端，子进程把结果 send 回来。
+    """
+    pipes = [multiprocessing.Pipe(duplex=False) for _ in args_list]
+    procs = start_workers(target, [(send, *args) for (_, send), args in zip(pipes, args_list)])
+    for _, send in pipes:
+        # 主进程关闭自己的发送端，子进程异常退出时 recv 得到 EOFError 而不是一直阻塞
+        send.close()
+    try:
+        # 先取回结果再 join，避免子进程阻塞在写满的管道上
+        results = [recv.recv() for recv, _ in pipes]
+    except EOFError:
+        join_workers(procs)
+        raise RuntimeError("worker process exited without a result") from None
+    join_workers(procs)
+    return results